@@ -85,6 +85,9 @@ def create_schema(conn: sqlite3.Connection) -> None:
 
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_cefr ON nodes(cefr_level)")
+    # Covers "nodes at this CEFR level" lookups that only need node_id
+    # (e.g. the secure-level counts in state/coach.py joining kg.nodes)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_cefr_node ON nodes(cefr_level, node_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_type ON edges(edge_type)")
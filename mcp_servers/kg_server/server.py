@@ -13,6 +13,8 @@ before the full knowledge graph is built.
 import json
 import logging
 import sqlite3
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -23,6 +25,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_EMPTY: frozenset = frozenset()
+
+# Evidence for a learner, falling back to the '__global__' placeholder rows
+# for nodes the learner has not practiced yet.
+_LEARNER_EVIDENCE_CTE = """
+    WITH learner_evidence AS (
+        SELECT node_id, success_count, error_count
+        FROM evidence
+        WHERE learner_id = :learner_id
+        UNION ALL
+        SELECT g.node_id, g.success_count, g.error_count
+        FROM evidence g
+        WHERE g.learner_id = '__global__'
+          AND :learner_id != '__global__'
+          AND NOT EXISTS (
+              SELECT 1 FROM evidence l
+              WHERE l.learner_id = :learner_id AND l.node_id = g.node_id
+          )
+    )
+"""
+
 
 class KGServerError(Exception):
     """Base exception for KG Server errors."""
@@ -39,6 +62,33 @@ class NodeNotFoundError(KGServerError):
     pass
 
 
+@dataclass(slots=True)
+class FrontierNode:
+    """
+    A knowledge graph node on the learner's frontier.
+
+    Attributes:
+        node_id: Unique identifier for the node
+        type: Node type (Lexeme, Construction, ...)
+        label: Human-readable label
+        cefr_level: CEFR level of the node
+        prerequisites_satisfied: Whether all prerequisites are satisfied
+        mastery_level: Fraction of successful attempts (0-1)
+        can_do: Can-do statements the node contributes to
+        priority_score: Selection priority (higher = practice sooner)
+        last_practiced: Timestamp of last practice, if known
+    """
+    node_id: str
+    type: str
+    label: str
+    cefr_level: Optional[str]
+    prerequisites_satisfied: bool
+    mastery_level: float
+    can_do: List[str] = field(default_factory=list)
+    priority_score: float = 0.0
+    last_practiced: Optional[str] = None
+
+
 class KGServer:
     """
     Knowledge Graph MCP Server
@@ -52,6 +102,10 @@ class KGServer:
         kg_db_path: Path to the knowledge graph SQLite database
         mastery_db_path: Path to the learner mastery SQLite database
         use_mock_data: Whether to use mock data (True until real DB is ready)
+
+    The prerequisite edges are static while the server runs, so they are
+    loaded once into an in-memory map; call reload_kg() after rebuilding
+    kg.sqlite.
     """
 
     def __init__(
@@ -73,7 +127,27 @@ class KGServer:
         if not self.kg_db_path.exists():
             raise DatabaseError(f"Knowledge graph database not found at {self.kg_db_path}")
         if not self.mastery_db_path.exists():
-            logger.warning(f"Mastery database not found at {self.mastery_db_path}, will create if needed")
+            logger.warning(
+                "Mastery database not found at %s, will create if needed",
+                self.mastery_db_path,
+            )
+
+        self._prereqs: Dict[str, frozenset] = self._load_prerequisites()
+
+    def _load_prerequisites(self) -> Dict[str, frozenset]:
+        """Map each node to the frozenset of its direct prerequisites."""
+        prereqs: Dict[str, set] = defaultdict(set)
+        with sqlite3.connect(self.kg_db_path) as conn:
+            for target_id, source_id in conn.execute(
+                "SELECT target_id, source_id FROM edges WHERE edge_type = 'prerequisite_of'"
+            ):
+                prereqs[target_id].add(source_id)
+        return {node_id: frozenset(sources) for node_id, sources in prereqs.items()}
+
+    def reload_kg(self) -> None:
+        """Rebuild cached knowledge graph structure after kg.sqlite changes."""
+        self._prereqs = self._load_prerequisites()
+        logger.info("Reloaded prerequisites for %d nodes", len(self._prereqs))
 
     def kg_next(self, learner_id: str, k: int = 5) -> str:
         """
@@ -93,7 +167,7 @@ class KGServer:
             KGServerError: If the query fails
         """
         try:
-            logger.info(f"kg.next called for learner={learner_id}, k={k}")
+            logger.info("kg.next called for learner=%s, k=%s", learner_id, k)
 
             if k < 1 or k > 50:
                 raise KGServerError(f"Invalid k value: {k}. Must be between 1 and 50.")
@@ -103,14 +177,14 @@ class KGServer:
             result = {
                 "learner_id": learner_id,
                 "count": len(nodes),
-                "nodes": nodes
+                "nodes": [asdict(node) for node in nodes]
             }
 
-            logger.info(f"Returning {len(nodes)} frontier nodes for {learner_id}")
+            logger.info("Returning %d frontier nodes for %s", len(nodes), learner_id)
             return json.dumps(result, indent=2)
 
         except Exception as e:
-            logger.error(f"Error in kg.next: {e}")
+            logger.exception("Error in kg.next")
             raise KGServerError(f"Failed to query frontier nodes: {e}")
 
     def kg_prompt(self, node_id: str, kind: str = "production") -> str:
@@ -133,7 +207,7 @@ class KGServer:
             KGServerError: If the query fails
         """
         try:
-            logger.info(f"kg.prompt called for node={node_id}, kind={kind}")
+            logger.info("kg.prompt called for node=%s, kind=%s", node_id, kind)
 
             valid_kinds = ["production", "recognition", "correction"]
             if kind not in valid_kinds:
@@ -141,11 +215,11 @@ class KGServer:
 
             prompt_data = self._query_node_prompt(node_id, kind)
 
-            logger.info(f"Returning {kind} prompt for node {node_id}")
+            logger.info("Returning %s prompt for node %s", kind, node_id)
             return json.dumps(prompt_data, indent=2)
 
         except Exception as e:
-            logger.error(f"Error in kg.prompt: {e}")
+            logger.exception("Error in kg.prompt")
             raise KGServerError(f"Failed to retrieve prompt for node {node_id}: {e}")
 
     def kg_add_evidence(self, node_id: str, success: bool, learner_id: Optional[str] = None) -> str:
@@ -183,115 +257,95 @@ class KGServer:
 
             result = self._update_node_evidence(node_id, learner_key, success)
 
-            logger.info(f"Evidence updated for node {node_id}")
+            logger.info("Evidence updated for node %s", node_id)
             return json.dumps(result, indent=2)
 
         except Exception as e:
-            logger.error(f"Error in kg.add_evidence: {e}")
+            logger.exception("Error in kg.add_evidence")
             raise KGServerError(f"Failed to update evidence for node {node_id}: {e}")
 
-    def _query_frontier_nodes(self, learner_id: str, k: int) -> List[Dict[str, Any]]:
+    def _query_frontier_nodes(self, learner_id: str, k: int) -> List[FrontierNode]:
         """
         Query the actual knowledge graph database for frontier nodes.
 
-        This method will be implemented when the KG schema is finalized.
-        It should:
-        1. Query nodes where all prerequisites are mastered
-        2. Exclude nodes that are already mastered by this learner
-        3. Calculate priority scores based on CEFR level, recency, and connections
-        4. Return top k nodes
+        A node is on the frontier when every prerequisite has at least one
+        successful attempt and the node itself has none. SQLite scores and
+        orders the unmastered candidates; prerequisites are checked against
+        the cached prerequisite map, and iteration stops after k matches.
         """
         with sqlite3.connect(self.kg_db_path) as conn_kg, \
              sqlite3.connect(self.mastery_db_path) as conn_mastery:
-            conn_kg.row_factory = sqlite3.Row
             conn_mastery.row_factory = sqlite3.Row
             cursor_kg = conn_kg.cursor()
-            cursor_mastery = conn_mastery.cursor()
+            params = {"learner_id": learner_id}
 
-            # 1. Get all nodes and their direct prerequisites
+            # For now the 'evidence' table in kg.sqlite stands in for mastery data;
+            # in a full implementation mastery.sqlite would hold FSRS-based state.
+            # Mastered (for now: at least one successful attempt)
             cursor_kg.execute(
-                """
-                SELECT
-                    n.node_id,
-                    n.type,
-                    n.label,
-                    n.cefr_level,
-                    n.data_json,
-                    GROUP_CONCAT(e.source_id) AS prerequisites
-                FROM nodes n
-                LEFT JOIN edges e ON n.node_id = e.target_id AND e.edge_type = 'prerequisite_of'
-                GROUP BY n.node_id
-                """
+                _LEARNER_EVIDENCE_CTE
+                + "SELECT node_id FROM learner_evidence WHERE success_count > 0",
+                params,
             )
-            all_nodes_data = cursor_kg.fetchall()
+            mastered = frozenset(row[0] for row in cursor_kg)
 
-            # 2. Get learner's mastery data from mastery.sqlite
-            # Assuming mastery.sqlite has a table 'mastery' with 'node_id', 'learner_id', 'mastery_level'
-            # For now, we'll use the 'evidence' table in kg.sqlite as a placeholder for mastery
-            # In a real scenario, mastery.sqlite would be more complex (e.g., FSRS data)
             cursor_kg.execute(
-                """
-                SELECT node_id, success_count, error_count
-                FROM evidence
-                WHERE learner_id = ?
+                _LEARNER_EVIDENCE_CTE
+                + """
+                , candidates AS (
+                    SELECT
+                        n.node_id,
+                        n.type,
+                        n.label,
+                        n.cefr_level,
+                        n.data_json,
+                        COALESCE(
+                            CAST(ev.success_count AS REAL)
+                            / NULLIF(ev.success_count + ev.error_count, 0),
+                            0.0
+                        ) AS mastery
+                    FROM nodes n
+                    LEFT JOIN learner_evidence ev ON ev.node_id = n.node_id
+                    WHERE COALESCE(ev.success_count, 0) = 0
+                )
+                SELECT
+                    node_id,
+                    type,
+                    label,
+                    cefr_level,
+                    data_json,
+                    mastery,
+                    -- Simple priority: less mastered = higher priority
+                    MAX(0.0, 1.0 - mastery) AS priority_score
+                FROM candidates
+                ORDER BY priority_score DESC, cefr_level DESC, label DESC
                 """,
-                (learner_id,),
+                params,
             )
-            learner_evidence = {row["node_id"]: row for row in cursor_kg.fetchall()}
 
-            if learner_id != "__global__":
-                cursor_kg.execute(
-                    """
-                    SELECT node_id, success_count, error_count
-                    FROM evidence
-                    WHERE learner_id = '__global__'
-                    """,
-                )
-                for row in cursor_kg.fetchall():
-                    learner_evidence.setdefault(row["node_id"], row)
-
-            frontier_nodes: List[Dict[str, Any]] = []
-
-            for node_row in all_nodes_data:
-                node_id = node_row['node_id']
-                prerequisites_str = node_row['prerequisites']
-                prerequisites = prerequisites_str.split(',') if prerequisites_str else []
-
-                # Check if all prerequisites are "mastered" (for now, just "seen" or "attempted successfully")
-                prereqs_satisfied = True
-                for prereq_id in prerequisites:
-                    if prereq_id not in learner_evidence or learner_evidence[prereq_id]['success_count'] == 0:
-                        prereqs_satisfied = False
-                        break
-
-                # Check if the node itself is already "mastered" by the learner
-                # For simplicity, consider mastered if success_count > 0
-                is_mastered = learner_evidence.get(node_id, {}).get('success_count', 0) > 0
-
-                if prereqs_satisfied and not is_mastered:
-                    node_data = json.loads(node_row['data_json'])
-                    evidence = learner_evidence.get(node_id, {'success_count': 0, 'error_count': 0})
-                    attempts = evidence['success_count'] + evidence['error_count']
-                    mastery = evidence['success_count'] / attempts if attempts else 0.0
-
-                    frontier_nodes.append(
-                        {
-                            "node_id": node_id,
-                            "type": node_row['type'],
-                            "label": node_row['label'],
-                            "cefr_level": node_row['cefr_level'],
-                            "prerequisites_satisfied": True,
-                            "mastery_level": round(mastery, 2),
-                            "can_do": node_data.get('can_do', []),
-                            "priority_score": max(0.0, 1.0 - mastery), # Simple priority: less mastered = higher priority
-                            "last_practiced": None # This would come from mastery.sqlite in full implementation
-                        }
+            prereqs = self._prereqs
+            frontier_nodes: List[FrontierNode] = []
+            for node_id, node_type, label, cefr_level, data_json, mastery, priority in cursor_kg:
+                if not prereqs.get(node_id, _EMPTY).issubset(mastered):
+                    continue
+
+                frontier_nodes.append(
+                    FrontierNode(
+                        node_id=node_id,
+                        type=node_type,
+                        label=label,
+                        cefr_level=cefr_level,
+                        prerequisites_satisfied=True,
+                        mastery_level=round(mastery, 2),
+                        can_do=json.loads(data_json).get('can_do', []),
+                        priority_score=priority,
+                        last_practiced=None,  # This would come from mastery.sqlite in full implementation
                     )
-            
-            # Sort by priority score (descending), then CEFR level, then label
-            frontier_nodes.sort(key=lambda x: (x['priority_score'], x['cefr_level'], x['label']), reverse=True)
+                )
+                if len(frontier_nodes) == k:
+                    break
 
-            return frontier_nodes[:k]
+            return frontier_nodes
 
     def _query_node_prompt(self, node_id: str, kind: str) -> Dict[str, Any]:
         """
@@ -355,53 +409,32 @@ class KGServer:
         """
         Update evidence counters in the knowledge graph database.
 
-        This method will be implemented when the KG schema is finalized.
+        The upsert returns the updated counters directly (SQLite >= 3.35), and
+        unknown node IDs are rejected by the evidence table's foreign key.
         """
+        success_inc = 1 if success else 0
+        error_inc = 0 if success else 1
+
         with sqlite3.connect(self.kg_db_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            conn.execute("PRAGMA foreign_keys = ON")
 
-            cursor.execute(
-                "SELECT 1 FROM nodes WHERE node_id = ?",
-                (node_id,),
-            )
-            if cursor.fetchone() is None:
-                raise NodeNotFoundError(f"Node {node_id} not found")
-
-            success_inc = 1 if success else 0
-            error_inc = 0 if success else 1
-
-            cursor.execute(
-                """
-                INSERT INTO evidence (node_id, learner_id, success_count, error_count, last_practiced)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(node_id, learner_id)
-                DO UPDATE SET
-                    success_count = success_count + ?,
-                    error_count = error_count + ?,
-                    last_practiced = CURRENT_TIMESTAMP
-                """,
-                (
-                    node_id,
-                    learner_id,
-                    success_inc,
-                    error_inc,
-                    success_inc,
-                    error_inc,
-                ),
-            )
-
-            conn.commit()
-
-            cursor.execute(
-                """
-                SELECT success_count, error_count, last_practiced
-                FROM evidence
-                WHERE node_id = ? AND learner_id = ?
-                """,
-                (node_id, learner_id),
-            )
-            row = cursor.fetchone()
+            try:
+                row = conn.execute(
+                    """
+                    INSERT INTO evidence (node_id, learner_id, success_count, error_count, last_practiced)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(node_id, learner_id)
+                    DO UPDATE SET
+                        success_count = success_count + excluded.success_count,
+                        error_count = error_count + excluded.error_count,
+                        last_practiced = CURRENT_TIMESTAMP
+                    RETURNING success_count, error_count, last_practiced
+                    """,
+                    (node_id, learner_id, success_inc, error_inc),
+                ).fetchone()
+            except sqlite3.IntegrityError as e:
+                raise NodeNotFoundError(f"Node {node_id} not found") from e
 
         return {
             "node_id": node_id,
@@ -10,6 +10,16 @@ from server import SpeechServer
 
 def main():
     parser = argparse.ArgumentParser(description="Speech Server CLI")
+    parser.add_argument(
+        "--asr-engine",
+        choices=["google", "vosk"],
+        default="google",
+        help="Speech recognition engine (default: google; vosk runs offline)",
+    )
+    parser.add_argument(
+        "--vosk-model",
+        help="Path to an unpacked Vosk model directory (used with --asr-engine vosk)",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # recognize command
@@ -22,7 +32,7 @@ def main():
 
     args = parser.parse_args()
 
-    server = SpeechServer()
+    server = SpeechServer(asr_engine=args.asr_engine, vosk_model_path=args.vosk_model)
 
     if args.command == "recognize":
         try:
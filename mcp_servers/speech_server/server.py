@@ -4,10 +4,16 @@ Speech Processing MCP Server Implementation
 Provides MCP tools for speech-to-text (ASR) and text-to-speech (TTS).
 """
 
+import json
 import logging
 import speech_recognition as sr
 import pyttsx3
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+try:
+    import vosk
+except ImportError:
+    vosk = None
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +26,13 @@ class SpeechServerError(Exception):
     """Base exception for Speech Server errors."""
     pass
 
+# Sample rate/width expected by the offline (Vosk) recognizer
+OFFLINE_SAMPLE_RATE = 16000
+OFFLINE_SAMPLE_WIDTH = 2
+
+ASR_ENGINES = ("google", "vosk")
+
+
 class SpeechServer:
     """
     Speech Processing MCP Server
@@ -27,15 +40,68 @@ class SpeechServer:
     Exposes two main tools:
     1. speech.recognize_from_mic: Capture audio from the microphone and return the recognized text.
     2. speech.synthesize_to_file: Convert text to speech and save it as an audio file.
+
+    Attributes:
+        asr_engine: Requested recognition engine ("google" or "vosk")
+        offline_model: Loaded Vosk model, or None when Google ASR is used
     """
 
-    def __init__(self):
+    def __init__(self, asr_engine: str = "google", vosk_model_path: Optional[str] = None):
         """
         Initialize the Speech Server.
+
+        Args:
+            asr_engine: "google" (cloud, default) or "vosk" (offline, on-device)
+            vosk_model_path: Path to an unpacked Vosk model directory (required for "vosk")
+
+        If the offline engine is requested but the vosk package or model is
+        unavailable, the server logs a warning and falls back to Google ASR.
         """
+        if asr_engine not in ASR_ENGINES:
+            raise SpeechServerError(f"Invalid asr_engine: {asr_engine}. Must be one of {ASR_ENGINES}")
+
+        self.asr_engine = asr_engine
         self.recognizer = sr.Recognizer()
         self.tts_engine = pyttsx3.init()
-        logger.info("SpeechServer initialized.")
+        self.offline_model = None
+
+        if asr_engine == "vosk":
+            self.offline_model = self._load_offline_model(vosk_model_path)
+
+        logger.info(
+            "SpeechServer initialized (asr=%s).",
+            "vosk" if self.offline_model is not None else "google",
+        )
+
+    @staticmethod
+    def _load_offline_model(model_path: Optional[str]) -> Optional[Any]:
+        """
+        Load the Vosk model once so each utterance only pays for decoding.
+
+        Returns None (Google fallback) when vosk or the model is unavailable.
+        """
+        if vosk is None:
+            logger.warning("vosk not installed (pip install vosk); falling back to Google ASR")
+            return None
+        if not model_path:
+            logger.warning("No Vosk model path given; falling back to Google ASR")
+            return None
+        try:
+            return vosk.Model(model_path)
+        except Exception:
+            logger.exception("Could not load Vosk model from %s; falling back to Google ASR", model_path)
+            return None
+
+    def _recognize_offline(self, audio: sr.AudioData) -> str:
+        """Decode captured audio with the local Vosk recognizer."""
+        recognizer = vosk.KaldiRecognizer(self.offline_model, OFFLINE_SAMPLE_RATE)
+        recognizer.AcceptWaveform(
+            audio.get_raw_data(convert_rate=OFFLINE_SAMPLE_RATE, convert_width=OFFLINE_SAMPLE_WIDTH)
+        )
+        text = json.loads(recognizer.FinalResult()).get("text", "")
+        if not text:
+            raise sr.UnknownValueError()
+        return text
 
     def recognize_from_mic(self) -> str:
         """
@@ -53,8 +119,11 @@ class SpeechServer:
                 audio = self.recognizer.listen(source)
 
             logger.info("Recognizing speech...")
-            text = self.recognizer.recognize_google(audio)
-            logger.info(f"Recognized text: {text}")
+            if self.offline_model is not None:
+                text = self._recognize_offline(audio)
+            else:
+                text = self.recognizer.recognize_google(audio)
+            logger.info("Recognized text: %s", text)
 
             result = {
                 "text": text
@@ -62,13 +131,15 @@ class SpeechServer:
             return json.dumps(result, indent=2)
 
         except sr.UnknownValueError:
-            logger.error("Google Speech Recognition could not understand audio")
+            logger.error("Speech recognition could not understand audio")
             raise SpeechServerError("Could not understand audio")
         except sr.RequestError as e:
-            logger.error(f"Could not request results from Google Speech Recognition service; {e}")
+            logger.error(
+                "Could not request results from Google Speech Recognition service; %s", e
+            )
             raise SpeechServerError(f"Speech service request failed: {e}")
         except Exception as e:
-            logger.error(f"Error in recognize_from_mic: {e}")
+            logger.exception("Error in recognize_from_mic")
             raise SpeechServerError(f"Failed to recognize speech: {e}")
 
     def synthesize_to_file(self, text: str, filepath: str) -> str:
@@ -85,7 +156,7 @@ class SpeechServer:
             JSON string containing the status and filepath.
         """
         try:
-            logger.info(f"Synthesizing text to file: {filepath}")
+            logger.info("Synthesizing text to file: %s", filepath)
             self.tts_engine.save_to_file(text, filepath)
             self.tts_engine.runAndWait()
 
@@ -93,11 +164,11 @@ class SpeechServer:
                 "success": True,
                 "filepath": filepath
             }
-            logger.info(f"Successfully synthesized text to {filepath}")
+            logger.info("Successfully synthesized text to %s", filepath)
             return json.dumps(result, indent=2)
 
         except Exception as e:
-            logger.error(f"Error in synthesize_to_file: {e}")
+            logger.exception("Error in synthesize_to_file")
             raise SpeechServerError(f"Failed to synthesize speech: {e}")
 
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
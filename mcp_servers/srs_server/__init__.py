@@ -16,6 +16,13 @@ Version: 0.1.0
 __version__ = "0.1.0"
 __author__ = "Spanish Learning Project"
 
-from .server import SRSServer
-
 __all__ = ["SRSServer"]
+
+
+def __getattr__(name):
+    # Import the server lazily so `python -m mcp_servers.srs_server --version`
+    # and --help don't pay for loading sqlite3, FSRS and the server module.
+    if name == "SRSServer":
+        from .server import SRSServer
+        return SRSServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
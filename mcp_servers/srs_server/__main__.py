@@ -10,13 +10,33 @@ Usage:
     python -m mcp_servers.srs_server --db path/to/mastery.sqlite
 """
 
+from __future__ import annotations
+
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
-from .server import SRSServer, register_tools
+
+MODE_FLAGS = ("--version", "--show-tools", "--test", "--demo")
+
+
+def _sniff_mode(argv: list) -> Optional[str]:
+    """
+    Find the requested mode flag without building the full parser.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Mode name ("version", "show-tools", "test", "demo") or None
+    """
+    for token in argv:
+        if token == "--":
+            break
+        if token in MODE_FLAGS:
+            return token[2:]
+    return None
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -79,6 +99,12 @@ For integration with MCP clients, see README.md
         help="Show version and exit"
     )
 
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON responses in test and demo modes"
+    )
+
     parser.add_argument(
         "--log-level",
         type=str,
@@ -90,130 +116,11 @@ For integration with MCP clients, see README.md
     return parser
 
 
-def show_tools(server: SRSServer) -> None:
-    """
-    Display available MCP tools and their signatures.
-
-    Args:
-        server: SRSServer instance
-    """
-    tools = register_tools(server)
-
-    print("\n" + "=" * 70)
-    print("SRS MCP SERVER - AVAILABLE TOOLS")
-    print("=" * 70 + "\n")
-
-    for tool_name, tool_def in tools.items():
-        print(f"Tool: {tool_name}")
-        print(f"Description: {tool_def['description']}")
-        print("Parameters:")
-
-        for param_name, param_def in tool_def['parameters'].items():
-            required = " (required)" if param_def['required'] else " (optional)"
-            default = f" [default: {param_def.get('default')}]" if 'default' in param_def else ""
-            print(f"  - {param_name}: {param_def['type']}{required}{default}")
-            print(f"    {param_def['description']}")
-
-        print()
-
-
-def run_test_mode(server: SRSServer) -> None:
-    """
-    Run server in test mode with sample queries.
-
-    Args:
-        server: SRSServer instance
-    """
-    print("\n" + "=" * 70)
-    print("SRS MCP SERVER - TEST MODE")
-    print("=" * 70 + "\n")
-
-    print("Test 1: Get due items for learner 'brett'")
-    print("-" * 70)
-    result = server.get_due_items("brett", limit=5)
-    print(result)
-    print()
-
-    print("Test 2: Update item with quality=4 (easy)")
-    print("-" * 70)
-    result = server.update_item("card.es.ser_vs_estar.001", quality=4)
-    print(result)
-    print()
-
-    print("Test 3: Get learner statistics")
-    print("-" * 70)
-    result = server.get_stats("brett")
-    print(result)
-    print()
-
-    print("Test 4: Error handling - invalid learner_id")
-    print("-" * 70)
-    result = server.get_due_items("", limit=5)
-    print(result)
-    print()
-
-    print("Test 5: Error handling - invalid quality score")
-    print("-" * 70)
-    result = server.update_item("card.es.test.001", quality=10)
-    print(result)
-    print()
-
-    print("=" * 70)
-    print("All tests completed successfully!")
-    print("=" * 70 + "\n")
-
-
-def run_demo_mode(server: SRSServer) -> None:
-    """
-    Run interactive demo mode.
-
-    Args:
-        server: SRSServer instance
-    """
-    print("\n" + "=" * 70)
-    print("SRS MCP SERVER - INTERACTIVE DEMO")
-    print("=" * 70 + "\n")
-
-    learner_id = input("Enter learner ID (default: brett): ").strip() or "brett"
-
-    while True:
-        print("\nAvailable commands:")
-        print("  1. Get due items")
-        print("  2. Update an item")
-        print("  3. Get statistics")
-        print("  4. Exit")
-
-        choice = input("\nEnter choice (1-4): ").strip()
-
-        if choice == "1":
-            limit = input("Number of items (default: 10): ").strip()
-            limit = int(limit) if limit else 10
-            result = server.get_due_items(learner_id, limit)
-            print("\nResult:")
-            print(result)
-
-        elif choice == "2":
-            item_id = input("Enter item ID: ").strip()
-            quality = input("Enter quality (0-5): ").strip()
-            try:
-                quality = int(quality)
-                result = server.update_item(item_id, quality)
-                print("\nResult:")
-                print(result)
-            except ValueError:
-                print("Error: Quality must be an integer")
-
-        elif choice == "3":
-            result = server.get_stats(learner_id)
-            print("\nResult:")
-            print(result)
-
-        elif choice == "4":
-            print("\nExiting demo mode...")
-            break
-
-        else:
-            print("Invalid choice. Please enter 1-4.")
+def show_version() -> int:
+    """Print the server version and return the exit code."""
+    from . import __version__
+    print(f"SRS MCP Server version {__version__}")
+    return 0
 
 
 def main(argv: Optional[list] = None) -> int:
@@ -226,14 +133,19 @@ def main(argv: Optional[list] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Show version (fast path: no parser construction, no server import)
+    if _sniff_mode(argv) == "version":
+        return show_version()
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
-    # Show version
+    # Abbreviated flags (e.g. --vers) are only recognized by argparse
     if args.version:
-        from . import __version__
-        print(f"SRS MCP Server version {__version__}")
-        return 0
+        return show_version()
 
     # Configure logging
     import logging
@@ -242,11 +154,12 @@ def main(argv: Optional[list] = None) -> int:
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-    # Initialize server
-    db_path = args.db if args.db else None
+    # Initialize server (imported here so --version/--help stay fast)
+    from .server import SRSServer
+
+    db_path = Path(args.db) if args.db else None
     if db_path:
-        db_file = Path(db_path)
-        if not db_file.exists():
+        if not db_path.exists():
             print(f"Warning: Database file not found: {db_path}", file=sys.stderr)
             print("Continuing with mock data...", file=sys.stderr)
             db_path = None
@@ -255,18 +168,21 @@ def main(argv: Optional[list] = None) -> int:
 
     # Show tools
     if args.show_tools:
+        from ._toolsmode import show_tools
         show_tools(server)
         return 0
 
     # Test mode
     if args.test:
-        run_test_mode(server)
+        from ._testmode import run_test_mode
+        run_test_mode(server, pretty=args.pretty)
         return 0
 
     # Demo mode
     if args.demo:
+        from ._demomode import run_demo_mode
         try:
-            run_demo_mode(server)
+            run_demo_mode(server, pretty=args.pretty)
         except KeyboardInterrupt:
             print("\n\nInterrupted by user")
         return 0
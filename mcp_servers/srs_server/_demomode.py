@@ -0,0 +1,68 @@
+"""
+SRS MCP Server --demo mode.
+
+Kept out of __main__ so other modes never load it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._testmode import print_result
+
+if TYPE_CHECKING:
+    from .server import SRSServer
+
+
+def run_demo_mode(server: SRSServer, pretty: bool = False) -> None:
+    """
+    Run interactive demo mode.
+
+    Args:
+        server: SRSServer instance
+        pretty: Indent JSON responses
+    """
+    print("\n" + "=" * 70)
+    print("SRS MCP SERVER - INTERACTIVE DEMO")
+    print("=" * 70 + "\n")
+
+    learner_id = input("Enter learner ID (default: brett): ").strip() or "brett"
+
+    while True:
+        print("\nAvailable commands:")
+        print("  1. Get due items")
+        print("  2. Update an item")
+        print("  3. Get statistics")
+        print("  4. Exit")
+
+        choice = input("\nEnter choice (1-4): ").strip()
+
+        if choice == "1":
+            limit = input("Number of items (default: 10): ").strip()
+            limit = int(limit) if limit else 10
+            result = server.get_due_items(learner_id, limit)
+            print("\nResult:")
+            print_result(result, pretty)
+
+        elif choice == "2":
+            item_id = input("Enter item ID: ").strip()
+            quality = input("Enter quality (0-5): ").strip()
+            try:
+                quality = int(quality)
+                result = server.update_item(item_id, quality)
+                print("\nResult:")
+                print_result(result, pretty)
+            except ValueError:
+                print("Error: Quality must be an integer")
+
+        elif choice == "3":
+            result = server.get_stats(learner_id)
+            print("\nResult:")
+            print_result(result, pretty)
+
+        elif choice == "4":
+            print("\nExiting demo mode...")
+            break
+
+        else:
+            print("Invalid choice. Please enter 1-4.")
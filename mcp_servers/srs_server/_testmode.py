@@ -0,0 +1,71 @@
+"""
+SRS MCP Server --test mode.
+
+Kept out of __main__ so other modes never load it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .server import SRSServer
+
+
+def print_result(result: str, pretty: bool = False) -> None:
+    """
+    Print a JSON tool response, re-indenting it if requested.
+
+    Args:
+        result: JSON string returned by an SRSServer tool
+        pretty: Indent the output for reading
+    """
+    print(json.dumps(json.loads(result), indent=2) if pretty else result)
+
+
+def run_test_mode(server: SRSServer, pretty: bool = False) -> None:
+    """
+    Run server in test mode with sample queries.
+
+    Args:
+        server: SRSServer instance
+        pretty: Indent JSON responses
+    """
+    print("\n" + "=" * 70)
+    print("SRS MCP SERVER - TEST MODE")
+    print("=" * 70 + "\n")
+
+    print("Test 1: Get due items for learner 'brett'")
+    print("-" * 70)
+    result = server.get_due_items("brett", limit=5)
+    print_result(result, pretty)
+    print()
+
+    print("Test 2: Update item with quality=4 (easy)")
+    print("-" * 70)
+    result = server.update_item("card.es.ser_vs_estar.001", quality=4)
+    print_result(result, pretty)
+    print()
+
+    print("Test 3: Get learner statistics")
+    print("-" * 70)
+    result = server.get_stats("brett")
+    print_result(result, pretty)
+    print()
+
+    print("Test 4: Error handling - invalid learner_id")
+    print("-" * 70)
+    result = server.get_due_items("", limit=5)
+    print_result(result, pretty)
+    print()
+
+    print("Test 5: Error handling - invalid quality score")
+    print("-" * 70)
+    result = server.update_item("card.es.test.001", quality=10)
+    print_result(result, pretty)
+    print()
+
+    print("=" * 70)
+    print("All tests completed successfully!")
+    print("=" * 70 + "\n")
@@ -0,0 +1,41 @@
+"""
+SRS MCP Server --show-tools mode.
+
+Kept out of __main__ so other modes never load it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .server import SRSServer
+
+
+def show_tools(server: SRSServer) -> None:
+    """
+    Display available MCP tools and their signatures.
+
+    Args:
+        server: SRSServer instance
+    """
+    from .server import register_tools
+
+    tools = register_tools(server)
+
+    print("\n" + "=" * 70)
+    print("SRS MCP SERVER - AVAILABLE TOOLS")
+    print("=" * 70 + "\n")
+
+    for tool_name, tool_def in tools.items():
+        print(f"Tool: {tool_name}")
+        print(f"Description: {tool_def['description']}")
+        print("Parameters:")
+
+        for param_name, param_def in tool_def['parameters'].items():
+            required = " (required)" if param_def['required'] else " (optional)"
+            default = f" [default: {param_def.get('default')}]" if 'default' in param_def else ""
+            print(f"  - {param_name}: {param_def['type']}{required}{default}")
+            print(f"    {param_def['description']}")
+
+        print()
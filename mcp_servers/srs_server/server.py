@@ -11,11 +11,11 @@ using a memory model based on DSR (Difficulty, Stability, Retrievability).
 import json
 import logging
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, asdict
-from state.fsrs import ReviewCard, ReviewResult, review_card, DEFAULT_W
 
 # Configure logging
 logging.basicConfig(
@@ -24,8 +24,146 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning; journal_mode=WAL is persistent and set once in __init__.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA foreign_keys = ON",
+)
+
+# Hot-path SQL kept as module constants so the connection's statement
+# cache reuses the prepared statements across calls.
+DUE_ITEMS_SQL = """
+    SELECT
+        item_id, node_id, type, last_review, next_review,
+        stability, difficulty, reps, lapses, state
+    FROM review_items
+    WHERE learner_id = ? AND next_review <= ?
+    ORDER BY next_review ASC
+    LIMIT ?
+"""
+
+# Single index probe on idx_review_items_learner_due
+LEARNER_HAS_ITEMS_SQL = "SELECT 1 FROM review_items WHERE learner_id = ? LIMIT 1"
+
+# srs.due response for a learner with no items; %s is the JSON-encoded learner_id
+_EMPTY_DUE_JSON = '{"items":[],"count":0,"learner_id":%s}'
+
+# Bulk form for executemany: rows carry absolute values, no result rows.
+UPSERT_ITEMS_SQL = """
+    INSERT INTO review_items (
+        item_id, learner_id, node_id, type, last_review, next_review,
+        stability, difficulty, reps, lapses, state
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(item_id) DO UPDATE SET
+        learner_id = excluded.learner_id,
+        node_id = excluded.node_id,
+        type = excluded.type,
+        last_review = excluded.last_review,
+        next_review = excluded.next_review,
+        stability = excluded.stability,
+        difficulty = excluded.difficulty,
+        reps = excluded.reps,
+        lapses = excluded.lapses,
+        state = excluded.state
+"""
+
+# Review form: the lapses parameter is an increment (0 or 1) added in SQL,
+# and the stored values are returned.
+UPSERT_ITEM_SQL = """
+    INSERT INTO review_items (
+        item_id, learner_id, node_id, type, last_review, next_review,
+        stability, difficulty, reps, lapses, state
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(item_id) DO UPDATE SET
+        last_review = excluded.last_review,
+        next_review = excluded.next_review,
+        stability = excluded.stability,
+        difficulty = excluded.difficulty,
+        reps = excluded.reps,
+        lapses = review_items.lapses + excluded.lapses,
+        state = excluded.state
+    RETURNING stability, difficulty, reps, lapses, state
+"""
+
+# All counters in a single scan of the learner's items, in LearnerStats
+# field order after learner_id.
+# Mastered = stability > 30 days (arbitrary threshold for now);
+# reviews today assume last_review is updated on every review.
+LEARNER_STATS_SQL = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(next_review <= :now), 0),
+        COALESCE(SUM(reps = 0), 0),
+        COALESCE(SUM(state IN (1, 3)), 0),
+        COALESCE(SUM(state = 2), 0),
+        COALESCE(SUM(stability > 30), 0),
+        COALESCE(ROUND(AVG(difficulty), 2), 0.0),
+        COALESCE(SUM(last_review >= :today_start), 0),
+        0  -- streak_days: TODO implement proper streak calculation
+    FROM review_items
+    WHERE learner_id = :learner_id
+"""
+
+FETCH_ITEM_SQL = """
+    SELECT learner_id, node_id, type, last_review, stability, difficulty, reps
+    FROM review_items
+    WHERE item_id = ?
+"""
+
+SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS review_items (
+        item_id TEXT PRIMARY KEY,
+        learner_id TEXT NOT NULL,
+        node_id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        last_review INTEGER,
+        next_review INTEGER NOT NULL,
+        stability REAL NOT NULL,
+        difficulty REAL NOT NULL,
+        reps INTEGER NOT NULL,
+        lapses INTEGER NOT NULL,
+        state INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    # Serves the due-items filter + ORDER BY next_review from the index;
+    # its learner_id prefix also covers the per-learner stats scan.
+    "CREATE INDEX IF NOT EXISTS idx_review_items_learner_due "
+    "ON review_items(learner_id, next_review)",
+    # Single-column indexes from older databases, superseded by the above
+    "DROP INDEX IF EXISTS idx_review_items_learner",
+    "DROP INDEX IF EXISTS idx_review_items_next_review",
+)
+
+SECONDS_PER_DAY = 86400
+
+# Conversion of rows written before timestamps were stored as Unix epoch
+# seconds; the typeof() filter makes it a no-op once they are converted.
+MIGRATE_EPOCH_SQL = (
+    "UPDATE review_items SET last_review = CAST(strftime('%s', last_review) AS INTEGER) "
+    "WHERE typeof(last_review) = 'text'",
+    "UPDATE review_items SET next_review = CAST(strftime('%s', next_review) AS INTEGER) "
+    "WHERE typeof(next_review) = 'text'",
+)
+
+STATEMENT_CACHE_SIZE = 256
 
-@dataclass
+
+def _epoch_to_iso(epoch: Optional[int]) -> Optional[str]:
+    """Format stored epoch seconds as the ISO 8601 UTC string tools return."""
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+
+# Compact output for MCP clients; the CLI re-indents with --pretty.
+JSON_SEPARATORS = (",", ":")
+
+
+@dataclass(slots=True)
 class FSRSParameters:
     """
     FSRS algorithm parameters for a single item.
@@ -48,7 +186,7 @@ class FSRSParameters:
     state: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewItem:
     """
     A single item due for review.
@@ -57,20 +195,19 @@ class ReviewItem:
         item_id: Unique identifier for the item
         node_id: Knowledge graph node this item relates to
         type: Type of review (production, recognition, etc.)
-        last_review: ISO timestamp of last review
-        due_date: ISO timestamp when item is due
+        last_review: Unix epoch seconds of last review (None if never reviewed)
+        due_date: Unix epoch seconds when item is due
         fsrs_params: Current FSRS parameters
     """
     item_id: str
     node_id: str
     type: str
-    last_review: str
-    due_date: str
+    last_review: Optional[int]
+    due_date: int
     fsrs_params: FSRSParameters
 
 
-@dataclass
-class LearnerStats:
+class LearnerStats(NamedTuple):
     """
     Learning statistics for a learner.
 
@@ -102,11 +239,12 @@ class SRSServer:
     """
     Main SRS MCP Server class.
 
-    This server provides four primary tools:
+    This server provides five primary tools:
     1. srs.due - Get items due for review
     2. srs.update - Update FSRS parameters after a review
-    3. srs.stats - Get learner statistics
-    4. srs.mastered - Get mastered items ready for fluency practice (Four Strands)
+    3. srs.batch_update - Update several reviews in one transaction
+    4. srs.stats - Get learner statistics
+    5. srs.mastered - Get mastered items ready for fluency practice (Four Strands)
 
     Uses SQLite database for persistent storage.
     """
@@ -119,187 +257,276 @@ class SRSServer:
             db_path: Path to mastery.sqlite database (defaults to ../state/mastery.sqlite)
         """
         self.db_path = db_path or Path(__file__).parent.parent.parent / "state" / "mastery.sqlite"
+        self._local = threading.local()
+
+        # Tool definitions, built by register_tools() on first use
+        self._tools: Optional[Dict[str, Any]] = None
+
+        # Open the creating thread's connection up front and keep it, so
+        # schema setup does not cost a throwaway connect.
+        conn = self._get_conn()
+
+        # WAL lets readers proceed during writes and needs fewer fsyncs per commit
+        # (journal_mode cannot change inside a transaction, so it goes first)
+        conn.execute("PRAGMA journal_mode = WAL")
+
+        # IF NOT EXISTS + BEGIN IMMEDIATE: idempotent on every start, and two
+        # processes starting together serialize instead of racing the DDL.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in SCHEMA_SQL + MIGRATE_EPOCH_SQL:
+                conn.execute(statement)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
-        if not self.db_path.exists():
-            # If the database doesn't exist, create it and its schema
-            logger.info(f"Mastery database not found at {self.db_path}, creating new one.")
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS review_items (
-                    item_id TEXT PRIMARY KEY,
-                    learner_id TEXT NOT NULL,
-                    node_id TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    last_review TIMESTAMP,
-                    next_review TIMESTAMP NOT NULL,
-                    stability REAL NOT NULL,
-                    difficulty REAL NOT NULL,
-                    reps INTEGER NOT NULL,
-                    lapses INTEGER NOT NULL,
-                    state INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_review_items_learner ON review_items(learner_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_review_items_next_review ON review_items(next_review)")
-            conn.commit()
-            conn.close()
-        
         logger.info(f"SRSServer initialized with db_path={self.db_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the mastery database with tuned PRAGMAs."""
+        # mode=rwc creates the file if missing; autocommit mode: writes
+        # manage their own BEGIN/COMMIT
+        conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=rwc",
+            uri=True,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Return this thread's long-lived connection, opening it on first use.
+
+        Reusing the connection keeps the page cache warm and avoids paying
+        connect + PRAGMA setup on every tool call.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's database connection, if open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
 
-    def _query_due_items(self, learner_id: str, limit: int) -> List[ReviewItem]:
+    def _query_due_items(
+        self, learner_id: str, limit: int, now: Optional[datetime] = None
+    ) -> List[ReviewItem]:
         """
         Query the mastery database for items due for review for a given learner.
+
+        Args:
+            now: Reference time (defaults to the current UTC time)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            now = datetime.now(timezone.utc)
-
-            cursor.execute(
-                """
-                SELECT
-                    item_id, node_id, type, last_review, next_review,
-                    stability, difficulty, reps, lapses, state
-                FROM review_items
-                WHERE learner_id = ? AND next_review <= ?
-                ORDER BY next_review ASC
-                LIMIT ?
-                """,
-                (learner_id, now.isoformat(), limit)
-            )
-            rows = cursor.fetchall()
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        now = int((now or datetime.now(timezone.utc)).timestamp())
+
+        cursor.execute(DUE_ITEMS_SQL, (learner_id, now, limit))
 
+        # Plain tuples: unpacking beats per-column name lookups on sqlite3.Row
         due_items: List[ReviewItem] = []
-        for row in rows:
+        for (
+            item_id, node_id, item_type, last_review, next_review,
+            stability, difficulty, reps, lapses, state,
+        ) in cursor:
             fsrs_params = FSRSParameters(
-                stability=row["stability"],
-                difficulty=row["difficulty"],
-                elapsed_days=(now - datetime.fromisoformat(row["last_review"])).days if row["last_review"] else 0,
-                scheduled_days=(datetime.fromisoformat(row["next_review"]) - now).days,
-                reps=row["reps"],
-                lapses=row["lapses"],
-                state=row["state"]
+                stability,
+                difficulty,
+                (now - last_review) // SECONDS_PER_DAY if last_review is not None else 0,
+                (next_review - now) // SECONDS_PER_DAY,
+                reps,
+                lapses,
+                state,
             )
             due_items.append(
-                ReviewItem(
-                    item_id=row["item_id"],
-                    node_id=row["node_id"],
-                    type=row["type"],
-                    last_review=row["last_review"],
-                    due_date=row["next_review"],
-                    fsrs_params=fsrs_params
-                )
+                ReviewItem(item_id, node_id, item_type, last_review, next_review, fsrs_params)
             )
         return due_items
 
-    def _update_srs_item(
-        self,
-        item_id: str,
-        learner_id: str,
-        node_id: str,
-        item_type: str,
-        new_params: FSRSParameters,
-        review_time: datetime,
-        next_review_date: datetime,
-    ) -> None:
+    def _apply_reviews(
+        self, reviews: List[Tuple[str, int]], now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Update or insert an SRS item in the database.
+        Run FSRS for each (item_id, quality) review and persist the results.
+
+        All reviews in the call share one review time, ``now`` (defaults to
+        the current UTC time).
+
+        All reads and upserts share one BEGIN IMMEDIATE transaction, so a
+        batch of N reviews costs a single commit. Each upsert RETURNs the
+        stored row, which is what gets reported back; a repeated item_id
+        later in the batch reads the row written by the earlier review.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # Deferred so importing the server (e.g. for --show-tools) skips FSRS
+        from state.fsrs import DEFAULT_W, ReviewCard, review_card
 
-            cursor.execute(
-                """
-                INSERT INTO review_items (
-                    item_id, learner_id, node_id, type, last_review, next_review,
-                    stability, difficulty, reps, lapses, state
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(item_id) DO UPDATE SET
-                    learner_id = excluded.learner_id,
-                    node_id = excluded.node_id,
-                    type = excluded.type,
-                    last_review = excluded.last_review,
-                    next_review = excluded.next_review,
-                    stability = excluded.stability,
-                    difficulty = excluded.difficulty,
-                    reps = excluded.reps,
-                    lapses = excluded.lapses,
-                    state = excluded.state
-                """,
-                (
-                    item_id,
-                    learner_id,
-                    node_id,
-                    item_type,
-                    review_time.isoformat(),
-                    next_review_date.isoformat(),
-                    new_params.stability, new_params.difficulty, new_params.reps, new_params.lapses, new_params.state
+        conn = self._get_conn()
+        review_timestamp = now or datetime.now(timezone.utc)
+        last_review = int(review_timestamp.timestamp())
+        results: List[Dict[str, Any]] = []
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for item_id, quality in reviews:
+                # Fetch current params from database or initialize if new
+                row = conn.execute(FETCH_ITEM_SQL, (item_id,)).fetchone()
+
+                if row:
+                    # Convert database row to ReviewCard
+                    (
+                        learner_id, node_id, item_type, previous_epoch,
+                        stability, difficulty, reps,
+                    ) = row
+                    previous_review_time = (
+                        datetime.fromtimestamp(previous_epoch, timezone.utc)
+                        if previous_epoch is not None
+                        else None
+                    )
+                    current_card = ReviewCard(
+                        stability=stability,
+                        difficulty=difficulty,
+                        reps=reps,
+                        last_review=previous_review_time
+                    )
+                else:
+                    # If item is new, initialize with default FSRS parameters
+                    # This assumes that new items are created with a default learner_id, node_id, and type.
+                    # In a real system, these would be passed in or derived.
+                    # For now, we'll use placeholder values and assume the item_id is unique.
+                    logger.warning(f"Item {item_id} not found, initializing with default FSRS parameters.")
+                    current_card = ReviewCard(
+                        stability=0.0, difficulty=0.0, reps=0, last_review=None
+                    )
+                    learner_id = "default_learner"
+                    node_id = "default_node"
+                    item_type = "default_type"
+                    previous_review_time = None
+
+                # Process review using the full FSRS algorithm
+                updated_card, review_result = review_card(
+                    current_card,
+                    quality,
+                    review_time=review_timestamp,
+                    w=DEFAULT_W,
                 )
-            )
-            conn.commit()
 
-    def _query_learner_stats(self, learner_id: str) -> LearnerStats:
+                # Save to database; state 2 assumes review state after update
+                stability, difficulty, reps, lapses, state = conn.execute(
+                    UPSERT_ITEM_SQL,
+                    (
+                        item_id,
+                        learner_id,
+                        node_id,
+                        item_type,
+                        last_review,
+                        int(review_result.next_review_date.timestamp()),
+                        updated_card.stability,
+                        updated_card.difficulty,
+                        updated_card.reps,
+                        1 if quality < 3 else 0,  # lapse increment
+                        2,
+                    ),
+                ).fetchone()
+
+                new_params = FSRSParameters(
+                    stability=stability,
+                    difficulty=difficulty,
+                    elapsed_days=(
+                        (review_timestamp - previous_review_time).days
+                        if previous_review_time
+                        else 0
+                    ),
+                    scheduled_days=(review_result.next_review_date - review_timestamp).days,
+                    reps=reps,
+                    lapses=lapses,
+                    state=state
+                )
+                results.append({
+                    "success": True,
+                    "item_id": item_id,
+                    "quality": quality,
+                    "updated_params": asdict(new_params),
+                    "next_review_date": review_result.next_review_date.isoformat(),
+                    "days_until_next": new_params.scheduled_days
+                })
+
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return results
+
+    def _update_srs_items_many(self, rows: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Upsert pre-computed review_items rows in a single transaction.
+
+        Intended for seeding and migrations, where FSRS state is already
+        known; rows are consumed lazily by executemany.
+
+        Args:
+            rows: Iterable of (item_id, learner_id, node_id, type, last_review,
+                next_review, stability, difficulty, reps, lapses, state) with
+                timestamps in Unix epoch seconds
+
+        Returns:
+            Number of rows written
+        """
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            count = conn.executemany(UPSERT_ITEMS_SQL, rows).rowcount
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return count
+
+    @staticmethod
+    def _validate_review(item_id: Any, quality: Any) -> Optional[Dict[str, str]]:
+        """Return an error payload for an invalid review, or None if valid."""
+        if not item_id or not isinstance(item_id, str):
+            return {
+                "error": "Invalid item_id",
+                "message": "item_id must be a non-empty string"
+            }
+
+        if not isinstance(quality, int) or quality < 0 or quality > 5:
+            return {
+                "error": "Invalid quality",
+                "message": "quality must be an integer between 0 and 5"
+            }
+
+        return None
+
+    def _query_learner_stats(
+        self, learner_id: str, now: Optional[datetime] = None
+    ) -> LearnerStats:
         """
         Query the mastery database for learner statistics.
+
+        Args:
+            now: Reference time (defaults to the current UTC time)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            now = datetime.now(timezone.utc)
-
-            # Total items
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ?", (learner_id,))
-            total_items = cursor.fetchone()[0]
-
-            # Due count
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ? AND next_review <= ?", (learner_id, now.isoformat()))
-            due_count = cursor.fetchone()[0]
-
-            # New count (reps = 0)
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ? AND reps = 0", (learner_id,))
-            new_count = cursor.fetchone()[0]
-
-            # Learning count (state = 1 or 3)
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ? AND (state = 1 OR state = 3)", (learner_id,))
-            learning_count = cursor.fetchone()[0]
-
-            # Review count (state = 2)
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ? AND state = 2", (learner_id,))
-            review_count = cursor.fetchone()[0]
-
-            # Mastered count (stability > 30 days, arbitrary threshold for now)
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ? AND stability > 30", (learner_id,))
-            mastered_count = cursor.fetchone()[0]
-
-            # Average difficulty
-            cursor.execute("SELECT AVG(difficulty) FROM review_items WHERE learner_id = ?", (learner_id,))
-            avg_difficulty = cursor.fetchone()[0]
-            average_difficulty = round(avg_difficulty, 2) if avg_difficulty else 0.0
-
-            # Reviews today (assuming last_review is updated on every review)
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-            cursor.execute("SELECT COUNT(*) FROM review_items WHERE learner_id = ? AND last_review >= ?", (learner_id, today_start))
-            reviews_today = cursor.fetchone()[0]
-
-            # Streak days (more complex, placeholder for now)
-            streak_days = 0 # TODO: Implement proper streak calculation
-
-        return LearnerStats(
-            learner_id=learner_id,
-            total_items=total_items,
-            due_count=due_count,
-            new_count=new_count,
-            learning_count=learning_count,
-            review_count=review_count,
-            mastered_count=mastered_count,
-            average_difficulty=average_difficulty,
-            reviews_today=reviews_today,
-            streak_days=streak_days
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        now = int((now or datetime.now(timezone.utc)).timestamp())
+        today_start = now - now % SECONDS_PER_DAY  # UTC midnight
+
+        cursor.execute(
+            LEARNER_STATS_SQL,
+            {"now": now, "today_start": today_start, "learner_id": learner_id},
         )
+        return LearnerStats(learner_id, *cursor.fetchone())
 
     def get_due_items(self, learner_id: str, limit: int = 10) -> str:
         """
@@ -318,37 +545,50 @@ class SRSServer:
             >>> server.get_due_items("brett", limit=5)
             '{"items": [...], "count": 3}'
         """
-        try:
-            logger.info(f"Getting due items for learner_id={learner_id}, limit={limit}")
+        logger.info(f"Getting due items for learner_id={learner_id}, limit={limit}")
 
-            # Validate inputs
-            if not learner_id or not isinstance(learner_id, str):
-                return json.dumps({
-                    "error": "Invalid learner_id",
-                    "message": "learner_id must be a non-empty string"
-                })
+        # Validate inputs
+        if not learner_id or not isinstance(learner_id, str):
+            return json.dumps({
+                "error": "Invalid learner_id",
+                "message": "learner_id must be a non-empty string"
+            })
 
-            if limit <= 0 or limit > 100:
-                return json.dumps({
-                    "error": "Invalid limit",
-                    "message": "limit must be between 1 and 100"
-                })
+        if not isinstance(limit, int) or limit <= 0 or limit > 100:
+            return json.dumps({
+                "error": "Invalid limit",
+                "message": "limit must be between 1 and 100"
+            })
+
+        try:
+            # Learners with no items at all skip the due query and serialization
+            if self._get_conn().execute(LEARNER_HAS_ITEMS_SQL, (learner_id,)).fetchone() is None:
+                logger.info(f"No items for learner_id={learner_id}")
+                return _EMPTY_DUE_JSON % json.dumps(learner_id)
 
             # Get items from database
             items = self._query_due_items(learner_id, limit)
 
-            # Convert to serializable format
-            items_dict = [
-                {
+            # Convert to serializable format (literal dicts: asdict() deep-copies)
+            items_dict = []
+            for item in items:
+                p = item.fsrs_params
+                items_dict.append({
                     "item_id": item.item_id,
                     "node_id": item.node_id,
                     "type": item.type,
-                    "last_review": item.last_review,
-                    "due_date": item.due_date,
-                    "fsrs_params": asdict(item.fsrs_params)
-                }
-                for item in items
-            ]
+                    "last_review": _epoch_to_iso(item.last_review),
+                    "due_date": _epoch_to_iso(item.due_date),
+                    "fsrs_params": {
+                        "stability": p.stability,
+                        "difficulty": p.difficulty,
+                        "elapsed_days": p.elapsed_days,
+                        "scheduled_days": p.scheduled_days,
+                        "reps": p.reps,
+                        "lapses": p.lapses,
+                        "state": p.state,
+                    },
+                })
 
             result = {
                 "items": items_dict,
@@ -357,7 +597,7 @@ class SRSServer:
             }
 
             logger.info(f"Returning {len(items_dict)} due items")
-            return json.dumps(result, indent=2)
+            return json.dumps(result, separators=JSON_SEPARATORS)
 
         except Exception as e:
             logger.error(f"Error in get_due_items: {e}", exc_info=True)
@@ -389,110 +629,71 @@ class SRSServer:
             >>> server.update_item("card.es.ser_vs_estar.001", quality=4)
             '{"success": true, "next_review_date": "2025-11-12T10:00:00Z"}'
         """
+        logger.info(f"Updating item_id={item_id} with quality={quality}")
+
+        # Validate inputs
+        error = self._validate_review(item_id, quality)
+        if error:
+            return json.dumps(error)
+
         try:
-            logger.info(f"Updating item_id={item_id} with quality={quality}")
+            result = self._apply_reviews([(item_id, quality)])[0]
 
-            # Validate inputs
-            if not item_id or not isinstance(item_id, str):
-                return json.dumps({
-                    "error": "Invalid item_id",
-                    "message": "item_id must be a non-empty string"
-                })
+            logger.info(f"Updated successfully. Next review in {result['days_until_next']} days")
+            return json.dumps(result, separators=JSON_SEPARATORS)
 
-            if not isinstance(quality, int) or quality < 0 or quality > 5:
-                return json.dumps({
-                    "error": "Invalid quality",
-                    "message": "quality must be an integer between 0 and 5"
-                })
+        except Exception as e:
+            logger.error(f"Error in update_item: {e}", exc_info=True)
+            return json.dumps({
+                "error": "Internal error",
+                "message": str(e)
+            })
 
-            # Fetch current params from database or initialize if new
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT * FROM review_items WHERE item_id = ?",
-                    (item_id,)
-                )
-                row = cursor.fetchone()
-
-            if row:
-                # Convert database row to ReviewCard
-                current_card = ReviewCard(
-                    stability=row["stability"],
-                    difficulty=row["difficulty"],
-                    reps=row["reps"],
-                    last_review=datetime.fromisoformat(row["last_review"]) if row["last_review"] else None
-                )
-                learner_id = row["learner_id"]
-                node_id = row["node_id"]
-                item_type = row["type"]
-                previous_review_time = current_card.last_review
-            else:
-                # If item is new, initialize with default FSRS parameters
-                # This assumes that new items are created with a default learner_id, node_id, and type.
-                # In a real system, these would be passed in or derived.
-                # For now, we'll use placeholder values and assume the item_id is unique.
-                logger.warning(f"Item {item_id} not found, initializing with default FSRS parameters.")
-                current_card = ReviewCard(
-                    stability=0.0, difficulty=0.0, reps=0, last_review=None
-                )
-                learner_id = "default_learner"
-                node_id = "default_node"
-                item_type = "default_type"
-                previous_review_time = None
-
-            # Process review using the full FSRS algorithm
-            review_timestamp = datetime.now(timezone.utc)
-            updated_card, review_result = review_card(
-                current_card,
-                quality,
-                review_time=review_timestamp,
-                w=DEFAULT_W,
-            )
+    def batch_update_items(self, reviews: List[Tuple[str, int]]) -> str:
+        """
+        MCP Tool: srs.batch_update
 
-            # Convert updated_card back to FSRSParameters for storage
-            existing_lapses = row["lapses"] if row else 0
-            new_lapses = existing_lapses + (1 if quality < 3 else 0)
-
-            new_params = FSRSParameters(
-                stability=updated_card.stability,
-                difficulty=updated_card.difficulty,
-                elapsed_days=(
-                    (review_timestamp - previous_review_time).days
-                    if previous_review_time
-                    else 0
-                ),
-                scheduled_days=(review_result.next_review_date - review_timestamp).days,
-                reps=updated_card.reps,
-                lapses=new_lapses,
-                state=2 # Assuming review state after update
-            )
+        Update FSRS parameters for several reviews in one transaction.
 
-            # Save to database
-            self._update_srs_item(
-                item_id,
-                learner_id,
-                node_id,
-                item_type,
-                new_params,
-                review_timestamp,
-                review_result.next_review_date,
-            )
+        Args:
+            reviews: List of (item_id, quality) pairs, quality 0-5 as in update_item
 
-            result = {
-                "success": True,
-                "item_id": item_id,
-                "quality": quality,
-                "updated_params": asdict(new_params),
-                "next_review_date": review_result.next_review_date.isoformat(),
-                "days_until_next": new_params.scheduled_days
-            }
+        Returns:
+            JSON string with one result per review, in input order
+
+        Example:
+            >>> server.batch_update_items([("card.es.ser.001", 4), ("card.es.estar.002", 2)])
+            '{"results": [...], "count": 2}'
+        """
+        # Validate inputs
+        if not isinstance(reviews, list):
+            return json.dumps({
+                "error": "Invalid reviews",
+                "message": "reviews must be a list of (item_id, quality) pairs"
+            })
+
+        for review in reviews:
+            if not isinstance(review, (list, tuple)) or len(review) != 2:
+                return json.dumps({
+                    "error": "Invalid review",
+                    "message": "each review must be an (item_id, quality) pair"
+                })
+            item_id, quality = review
+            error = self._validate_review(item_id, quality)
+            if error:
+                error["item_id"] = item_id
+                return json.dumps(error)
+
+        logger.info(f"Batch updating {len(reviews)} items")
+
+        try:
+            results = self._apply_reviews(reviews) if reviews else []
 
-            logger.info(f"Updated successfully. Next review in {new_params.scheduled_days} days")
-            return json.dumps(result, indent=2)
+            logger.info(f"Batch updated {len(results)} items")
+            return json.dumps({"results": results, "count": len(results)}, separators=JSON_SEPARATORS)
 
         except Exception as e:
-            logger.error(f"Error in update_item: {e}", exc_info=True)
+            logger.error(f"Error in batch_update_items: {e}", exc_info=True)
             return json.dumps({
                 "error": "Internal error",
                 "message": str(e)
@@ -514,23 +715,23 @@ class SRSServer:
             >>> server.get_stats("brett")
             '{"learner_id": "brett", "total_items": 247, ...}'
         """
-        try:
-            logger.info(f"Getting stats for learner_id={learner_id}")
+        logger.info(f"Getting stats for learner_id={learner_id}")
 
-            # Validate inputs
-            if not learner_id or not isinstance(learner_id, str):
-                return json.dumps({
-                    "error": "Invalid learner_id",
-                    "message": "learner_id must be a non-empty string"
-                })
+        # Validate inputs
+        if not learner_id or not isinstance(learner_id, str):
+            return json.dumps({
+                "error": "Invalid learner_id",
+                "message": "learner_id must be a non-empty string"
+            })
 
+        try:
             # Get stats from database
             stats = self._query_learner_stats(learner_id)
 
-            result = asdict(stats)
+            result = stats._asdict()
 
             logger.info(f"Returning stats for {learner_id}")
-            return json.dumps(result, indent=2)
+            return json.dumps(result, separators=JSON_SEPARATORS)
 
         except Exception as e:
             logger.error(f"Error in get_stats: {e}", exc_info=True)
@@ -561,78 +762,83 @@ class SRSServer:
             >>> server.get_mastered_items("brett", limit=10)
             '{"items": [...], "count": 5}'
         """
-        try:
-            logger.info(f"Getting mastered items for learner_id={learner_id}, limit={limit}")
+        logger.info(f"Getting mastered items for learner_id={learner_id}, limit={limit}")
 
-            # Validate inputs
-            if not learner_id or not isinstance(learner_id, str):
-                return json.dumps({
-                    "error": "Invalid learner_id",
-                    "message": "learner_id must be a non-empty string"
-                })
+        # Validate inputs
+        if not learner_id or not isinstance(learner_id, str):
+            return json.dumps({
+                "error": "Invalid learner_id",
+                "message": "learner_id must be a non-empty string"
+            })
 
-            if limit <= 0 or limit > 100:
-                return json.dumps({
-                    "error": "Invalid limit",
-                    "message": "limit must be between 1 and 100"
-                })
+        if not isinstance(limit, int) or limit <= 0 or limit > 100:
+            return json.dumps({
+                "error": "Invalid limit",
+                "message": "limit must be between 1 and 100"
+            })
 
+        try:
             # Query mastered items using fluency_ready_items view
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                # Try to use fluency_ready_items view (from Four Strands migration)
-                # Falls back to direct query if view doesn't exist
-                try:
-                    cursor.execute("""
-                        SELECT
-                            item_id,
-                            node_id,
-                            type,
-                            stability,
-                            reps,
-                            difficulty,
-                            last_review,
-                            mastery_status
-                        FROM fluency_ready_items
-                        LIMIT ?
-                    """, (limit,))
-                except sqlite3.OperationalError:
-                    # Fallback if view doesn't exist (pre-Four Strands schema)
-                    logger.warning("fluency_ready_items view not found, using fallback query")
-                    cursor.execute("""
-                        SELECT
-                            item_id,
-                            node_id,
-                            type,
-                            stability,
-                            reps,
-                            difficulty,
-                            last_review,
-                            'mastered' as mastery_status
-                        FROM review_items
-                        WHERE learner_id = ?
-                            AND stability >= 21.0
-                            AND reps >= 3
-                        ORDER BY last_review ASC
-                        LIMIT ?
-                    """, (learner_id, limit))
-
-                rows = cursor.fetchall()
+            conn = self._get_conn()
+            cursor = conn.cursor()
+
+            # Try to use fluency_ready_items view (from Four Strands migration)
+            # Falls back to direct query if view doesn't exist
+            epoch_last_review = False
+            try:
+                cursor.execute("""
+                    SELECT
+                        item_id,
+                        node_id,
+                        type,
+                        stability,
+                        reps,
+                        difficulty,
+                        last_review,
+                        mastery_status
+                    FROM fluency_ready_items
+                    LIMIT ?
+                """, (limit,))
+            except sqlite3.OperationalError:
+                # Fallback if view doesn't exist (pre-Four Strands schema)
+                logger.warning("fluency_ready_items view not found, using fallback query")
+                # review_items stores last_review as epoch seconds
+                epoch_last_review = True
+                cursor.execute("""
+                    SELECT
+                        item_id,
+                        node_id,
+                        type,
+                        stability,
+                        reps,
+                        difficulty,
+                        last_review,
+                        'mastered' as mastery_status
+                    FROM review_items
+                    WHERE learner_id = ?
+                        AND stability >= 21.0
+                        AND reps >= 3
+                    ORDER BY last_review ASC
+                    LIMIT ?
+                """, (learner_id, limit))
 
             # Convert to serializable format
             items = []
-            for row in rows:
+            for (
+                item_id, node_id, item_type, stability, reps, difficulty,
+                last_review, mastery_status,
+            ) in cursor:
+                if epoch_last_review:
+                    last_review = _epoch_to_iso(last_review)
                 items.append({
-                    "item_id": row["item_id"],
-                    "node_id": row["node_id"],
-                    "type": row["type"],
-                    "stability": row["stability"],
-                    "reps": row["reps"],
-                    "difficulty": row["difficulty"],
-                    "last_review": row["last_review"],
-                    "mastery_status": row["mastery_status"]
+                    "item_id": item_id,
+                    "node_id": node_id,
+                    "type": item_type,
+                    "stability": stability,
+                    "reps": reps,
+                    "difficulty": difficulty,
+                    "last_review": last_review,
+                    "mastery_status": mastery_status
                 })
 
             result = {
@@ -642,7 +848,7 @@ class SRSServer:
             }
 
             logger.info(f"Returning {len(items)} mastered items")
-            return json.dumps(result, indent=2)
+            return json.dumps(result, separators=JSON_SEPARATORS)
 
         except Exception as e:
             logger.error(f"Error in get_mastered_items: {e}", exc_info=True)
@@ -658,12 +864,22 @@ def register_tools(server: SRSServer) -> Dict[str, Any]:
     """
     Register MCP tools with their metadata.
 
+    The definitions are static, so they are built on the first call and kept
+    on the server; later calls for the same server return that mapping.
+
     Args:
         server: SRSServer instance
 
     Returns:
         Dictionary of tool definitions
     """
+    if server._tools is None:
+        server._tools = _build_tools(server)
+    return server._tools
+
+
+def _build_tools(server: SRSServer) -> Dict[str, Any]:
+    """Build the tool definitions for register_tools(), bound to ``server``."""
     return {
         "srs.due": {
             "function": server.get_due_items,
@@ -698,6 +914,17 @@ def register_tools(server: SRSServer) -> Dict[str, Any]:
                 }
             }
         },
+        "srs.batch_update": {
+            "function": server.batch_update_items,
+            "description": "Update FSRS parameters for several reviews in one transaction",
+            "parameters": {
+                "reviews": {
+                    "type": "array",
+                    "description": "List of [item_id, quality] pairs (quality 0-5)",
+                    "required": True
+                }
+            }
+        },
         "srs.stats": {
             "function": server.get_stats,
             "description": "Get learning statistics for a learner",
@@ -3,7 +3,8 @@
 Normalize local Spanish frequency resources into tabular TSV files and a SQLite index.
 
 This script relies only on the Python standard library so it can run inside the
-current sandboxed environment. It processes the following inputs (if present):
+current sandboxed environment (lxml, if installed, speeds up XLSX parsing).
+It processes the following inputs (if present):
 
 - corpora-frequency/SUBTLEX-ESP.xlsx
 - corpora-frequency/Multilex_Spanish_word_frequency.xlsx
@@ -22,10 +23,20 @@ and a consolidated SQLite database at:
 from __future__ import annotations
 
 import csv
+import functools
+import re
 import sqlite3
+import string
 import xml.etree.ElementTree as ET
 import zipfile
+from itertools import islice
 from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # Optional: faster tag-filtered iterparse
+    lxml_etree = None
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 RAW_DIR = BASE_DIR / "corpora-frequency"
@@ -34,161 +45,258 @@ OUTPUT_DIR = BASE_DIR / "data" / "frequency" / "normalized"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 SQLITE_PATH = BASE_DIR / "data" / "frequency" / "frequency.sqlite"
 
-
-def chunk_subtlex_columns(row: list[str]) -> list[dict[str, str]]:
-    """Split a SUBTLEX row into blocks of four columns (Word, Freq count, etc.)."""
-    blocks: list[dict[str, str]] = []
-    headers = ["Word", "Freq. count", "Freq. per million", "Log freq."]
+T = TypeVar("T")
+
+# The index is rebuilt from scratch on every run, so durability during the
+# load is irrelevant: skip fsyncs and keep the rollback journal in memory.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -200000",
+    "PRAGMA locking_mode = EXCLUSIVE",
+)
+
+# Rows per executemany call; bounds the parameter batch held in memory.
+INSERT_BATCH_SIZE = 10_000
+
+SUBTLEX_HEADER = ("word", "freq_count", "freq_per_million", "log_freq")
+
+# uniqueCount sits on the root <sst> tag, within the first few hundred bytes.
+UNIQUE_COUNT_RE = re.compile(rb'<(?:\w+:)?sst\b[^>]*\buniqueCount="(\d+)"')
+SST_HEADER_BYTES = 1024
+
+# Columns searched by tools/frequency_lookup.py, which matches on
+# lower(column). Indexed on that expression once the bulk load has
+# committed, so index maintenance never slows the inserts.
+LOOKUP_COLUMNS: dict[str, tuple[str, ...]] = {
+    "subtlex": ("word",),
+    "multilex": ("Palabra",),
+    "gpt_familiarity": ("Word",),
+    "gpt_affect": ("Word",),
+    "lemma40k": ("lemma",),
+    "form40k": ("word", "lemma"),
+    "form200k": ("word",),
+}
+
+
+def batched(iterable: Iterable[T], n: int) -> Iterator[list[T]]:
+    """Yield successive lists of up to ``n`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
+
+
+def chunk_subtlex_columns(row: list[str]) -> list[tuple[str, str, str, str]]:
+    """
+    Split a SUBTLEX row into blocks of four columns, returned as stripped
+    (word, freq_count, freq_per_million, log_freq) tuples.
+    """
+    blocks: list[tuple[str, str, str, str]] = []
+    n = len(row)
 
     i = 0
-    while i < len(row):
+    while i < n:
         # Skip blank separators
         if not row[i]:
             i += 1
             continue
 
-        chunk = row[i : i + 4]
-        if len(chunk) < 4 or not chunk[0]:
+        if i + 4 > n:
             break
 
-        entry = dict(zip(headers, chunk))
-        blocks.append(entry)
+        blocks.append((row[i].strip(), row[i + 1].strip(), row[i + 2].strip(), row[i + 3].strip()))
         i += 4
 
     return blocks
 
 
-def parse_xlsx_table(path: Path) -> list[list[str]]:
-    """
-    Read the first worksheet of an XLSX file and return rows as lists of cell values.
-    Only string and numeric types are supported; formula results are not evaluated.
-    """
-    if not path.exists():
-        return []
+@functools.cache
+def column_letters_index(letters: str) -> int:
+    """Convert column letters such as ``"AB"`` to a zero-based column index."""
+    idx = 0
+    for char in letters:
+        idx = idx * 26 + (ord(char.upper()) - ord("A") + 1)
+    return idx - 1
 
-    with zipfile.ZipFile(path) as zf:
-        sheet = ET.parse(zf.open("xl/worksheets/sheet1.xml")).getroot()
-        ns = {"a": sheet.tag.split("}")[0].strip("{")}
 
-        # Load shared strings table (if any)
-        shared_strings: list[str] = []
-        try:
-            shared_root = ET.parse(zf.open("xl/sharedStrings.xml")).getroot()
-            ns_shared = {"a": shared_root.tag.split("}")[0].strip("{")}
-            for si in shared_root.findall("a:si", ns_shared):
-                text_parts = [t.text or "" for t in si.findall(".//a:t", ns_shared)]
-                shared_strings.append("".join(text_parts))
-        except KeyError:
-            shared_root = None
-
-        def col_index(cell_ref: str) -> int:
-            idx = 0
-            for char in cell_ref:
-                if char.isdigit():
-                    break
-                idx = idx * 26 + (ord(char.upper()) - ord("A") + 1)
-            return idx - 1
-
-        rows: list[dict[int, str]] = []
-        for row in sheet.find("a:sheetData", ns).findall("a:row", ns):
-            row_cells: dict[int, str] = {}
-            for c in row.findall("a:c", ns):
-                cell_ref = c.attrib.get("r")
-                if cell_ref is None:
-                    continue
-                idx = col_index(cell_ref)
-                cell_type = c.attrib.get("t")
-                value = ""
-
-                v = c.find("a:v", ns)
-                if v is not None:
-                    raw = v.text or ""
-                    if cell_type == "s":
-                        value = shared_strings[int(raw)] if shared_strings else raw
-                    else:
-                        value = raw
-                else:
-                    inline = c.find("a:is", ns)
-                    if inline is not None:
-                        parts = [t.text or "" for t in inline.findall(".//a:t", ns)]
-                        value = "".join(parts)
+def col_index(cell_ref: str) -> int:
+    """Convert a cell reference such as ``"AB12"`` to a zero-based column index."""
+    # rstrip peels the row number in C; the letters repeat on every row, so
+    # the conversion itself is a cache hit after the first row.
+    return column_letters_index(cell_ref.rstrip(string.digits))
 
-                row_cells[idx] = value.strip()
 
-            if row_cells:
-                rows.append(row_cells)
+def iter_xml_elements(source: IO[bytes], *local_names: str) -> Iterator[Any]:
+    """
+    Yield elements with the given local names (in any namespace) as soon as
+    each one has been parsed, clearing it once the caller moves on so memory
+    stays flat regardless of document size.
+    """
+    if lxml_etree is not None:
+        tags = [f"{{*}}{name}" for name in local_names]
+        for _, elem in lxml_etree.iterparse(source, events=("end",), tag=tags):
+            yield elem
+            elem.clear()
+            # Also drop the already-processed siblings the parent still holds
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        # ElementTree has no getparent(): track the open ancestors instead, so
+        # each processed element can be detached from its parent as well
+        suffixes = tuple("}" + name for name in local_names)
+        parents: list[Any] = []
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if elem.tag.endswith(suffixes):
+                yield elem
+                elem.clear()
+                if parents:
+                    parents[-1].remove(elem)
 
-        if not rows:
-            return []
 
-        max_col = max(max(r.keys()) for r in rows)
-        matrix: list[list[str]] = []
-        for row_cells in rows:
-            row = [""] * (max_col + 1)
-            for idx, value in row_cells.items():
-                if 0 <= idx < len(row):
-                    row[idx] = value
-            matrix.append(row)
+def read_shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    """
+    Load the workbook's shared strings table (empty if there is none).
 
-        return matrix
+    The list is sized up front from the ``uniqueCount`` attribute on the
+    root ``<sst>`` element instead of growing one append at a time.
+    """
+    try:
+        with zf.open("xl/sharedStrings.xml") as stream:
+            match = UNIQUE_COUNT_RE.search(stream.read(SST_HEADER_BYTES))
+    except KeyError:
+        return []
 
+    expected = int(match.group(1)) if match else 0
+    shared_strings: list[str] = [""] * expected
+    count = 0
+    t_tag = None
+    with zf.open("xl/sharedStrings.xml") as stream:
+        for si in iter_xml_elements(stream, "si"):
+            if t_tag is None:
+                t_tag = si.tag[: si.tag.index("}") + 1] + "t"
+            # <t> runs may be nested in <r> rich-text runs; iter() finds them all
+            text = "".join([t.text or "" for t in si.iter(t_tag)])
+            if count < expected:
+                shared_strings[count] = text
+            else:
+                shared_strings.append(text)
+            count += 1
+
+    # uniqueCount is advisory; drop slots it over-reserved
+    del shared_strings[count:]
+    return shared_strings
+
+
+def cell_value(c: ET.Element, shared_strings: list[str], v_tag: str, is_tag: str, t_tag: str) -> str:
+    """Return a ``<c>`` cell's text, resolving shared-string and inline-string cells."""
+    # One pass over the children: the first <v> or <is> wins
+    for child in c:
+        tag = child.tag
+        if tag == v_tag:
+            raw = child.text or ""
+            if c.attrib.get("t") == "s":
+                return shared_strings[int(raw)] if shared_strings else raw
+            return raw
+        if tag == is_tag:
+            return "".join([t.text or "" for t in child.iter(t_tag)])
+    return ""
+
+
+def iter_xlsx_rows(path: Path) -> Iterator[list[str]]:
+    """
+    Stream the first worksheet of an XLSX file as lists of cell values.
 
-def normalize_subtlex() -> Path | None:
-    xlsx_path = RAW_DIR / "SUBTLEX-ESP.xlsx"
-    if not xlsx_path.exists():
-        return None
+    Rows are padded to the width declared by the sheet's ``<dimension>``
+    element (or to their own last cell if there is none); empty rows are
+    skipped. Only string and numeric types are supported; formula results
+    are not evaluated.
+    """
+    if not path.exists():
+        return
 
-    rows = parse_xlsx_table(xlsx_path)
-    if not rows:
-        return None
+    with zipfile.ZipFile(path) as zf:
+        shared_strings = read_shared_strings(zf)
+
+        width = 0
+        c_tag = v_tag = is_tag = t_tag = None
+        with zf.open("xl/worksheets/sheet1.xml") as stream:
+            for row in iter_xml_elements(stream, "dimension", "row"):
+                if row.tag.endswith("}dimension"):
+                    ref = row.attrib.get("ref", "")
+                    width = col_index(ref.rpartition(":")[2]) + 1
+                    continue
+                if c_tag is None:
+                    ns = row.tag[: row.tag.index("}") + 1]
+                    c_tag, v_tag, is_tag, t_tag = (f"{ns}{name}" for name in ("c", "v", "is", "t"))
+
+                # Cells arrive in column order, so build the row list directly,
+                # filling any skipped columns with empty strings as we go
+                values: list[str] = []
+                has_cells = False
+                for c in row:
+                    if c.tag != c_tag:
+                        continue
+                    attrib = c.attrib
+                    cell_ref = attrib.get("r")
+                    if cell_ref is None:
+                        continue
+                    has_cells = True
+                    idx = col_index(cell_ref)
+                    if idx < 0:
+                        continue
+                    value = cell_value(c, shared_strings, v_tag, is_tag, t_tag)
+
+                    filled = len(values)
+                    if idx >= filled:
+                        values.extend([""] * (idx - filled))
+                        values.append(value.strip())
+                    else:
+                        values[idx] = value.strip()
 
-    normalized_rows: list[list[str]] = [["word", "freq_count", "freq_per_million", "log_freq"]]
+                if not has_cells:
+                    continue
 
-    # Start after header row
-    for row in rows[1:]:
-        for block in chunk_subtlex_columns(row):
-            word = block.get("Word", "").strip()
-            if not word:
-                continue
-            normalized_rows.append(
-                [
-                    word,
-                    block.get("Freq. count", "").strip(),
-                    block.get("Freq. per million", "").strip(),
-                    block.get("Log freq.", "").strip(),
-                ]
-            )
-
-    output_path = OUTPUT_DIR / "subtlex.tsv"
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f, delimiter="\t")
-        writer.writerows(normalized_rows)
+                if len(values) < width:
+                    values.extend([""] * (width - len(values)))
+                yield values
 
-    return output_path
 
+def parse_xlsx_table(path: Path) -> list[list[str]]:
+    """
+    Read the first worksheet of an XLSX file and return rows as lists of cell values,
+    all padded to the same width.
+    """
+    rows = list(iter_xlsx_rows(path))
+    if not rows:
+        return []
 
-def copy_simple_xlsx(stem: str) -> Path | None:
-    xlsx_path = RAW_DIR / f"{stem}.xlsx"
-    if not xlsx_path.exists():
-        return None
+    max_width = max(len(row) for row in rows)
+    for row in rows:
+        row.extend([""] * (max_width - len(row)))
+    return rows
 
-    rows = parse_xlsx_table(xlsx_path)
-    if not rows:
-        return None
 
-    output_path = OUTPUT_DIR / f"{stem.lower()}.tsv"
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f, delimiter="\t")
-        writer.writerows(rows)
-    return output_path
+def iter_subtlex_rows(xlsx_path: Path) -> Iterator[Sequence[str]]:
+    """Yield the normalized SUBTLEX header, then one (word, ...) tuple per entry."""
+    rows = iter_xlsx_rows(xlsx_path)
+    if next(rows, None) is None:
+        return
 
+    yield SUBTLEX_HEADER
+    # Header row already consumed above
+    for row in rows:
+        for block in chunk_subtlex_columns(row):
+            if block[0]:
+                yield block
 
-def normalize_spanish_frequency_text(filename: str, output_name: str) -> Path | None:
-    source_path = RAW_TXT_DIR / filename
-    if not source_path.exists():
-        return None
 
-    output_path = OUTPUT_DIR / output_name
+def iter_spanish_frequency_text(source_path: Path) -> Iterator[list[str]]:
+    """Yield the tab-separated rows of a span_*.txt list, skipping comment lines."""
     text = None
     for encoding in ("utf-8", "latin-1", "cp1252"):
         try:
@@ -197,77 +305,123 @@ def normalize_spanish_frequency_text(filename: str, output_name: str) -> Path |
         except UnicodeDecodeError:
             continue
     if text is None:
-        raise UnicodeError(f"Unable to decode {filename} with utf-8/latin-1/cp1252")
-
-    with output_path.open("w", encoding="utf-8", newline="") as dst:
-        writer = csv.writer(dst, delimiter="\t")
-        for raw_line in text.splitlines():
-            stripped = raw_line.strip()
-            if not stripped or stripped.startswith("*") or stripped.startswith("---"):
-                continue
-            if stripped.startswith("ID"):
-                writer.writerow(stripped.split("\t"))
-                continue
-            writer.writerow(stripped.split("\t"))
-    return output_path
+        raise UnicodeError(f"Unable to decode {source_path.name} with utf-8/latin-1/cp1252")
 
+    for raw_line in text.splitlines():
+        stripped = raw_line.strip()
+        if not stripped or stripped.startswith("*") or stripped.startswith("---"):
+            continue
+        yield stripped.split("\t")
+
+
+def frequency_sources() -> list[tuple[str, Path, Path, Callable[[Path], Iterator[Sequence[str]]]]]:
+    """List (table, source file, normalized TSV, row iterator) for every input."""
+    sources = [("subtlex", RAW_DIR / "SUBTLEX-ESP.xlsx", OUTPUT_DIR / "subtlex.tsv", iter_subtlex_rows)]
+    for table, stem in (
+        ("multilex", "Multilex_Spanish_word_frequency"),
+        ("gpt_familiarity", "GPT familiarity estimates Spanish words"),
+        ("gpt_affect", "GPT_estimates_valence_arousal_concreteness"),
+    ):
+        sources.append((table, RAW_DIR / f"{stem}.xlsx", OUTPUT_DIR / f"{stem.lower()}.tsv", iter_xlsx_rows))
+    for table, filename, output_name in (
+        ("lemma40k", "span_40k_lemmas.txt", "spanish_lemmas_40k.tsv"),
+        ("form40k", "span_40k_forms.txt", "spanish_forms_40k.tsv"),
+        ("form200k", "span_200k.txt", "spanish_forms_200k.tsv"),
+    ):
+        sources.append((table, RAW_TXT_DIR / filename, OUTPUT_DIR / output_name, iter_spanish_frequency_text))
+    return sources
+
+
+def stream_to_tsv_and_sqlite(
+    cur: sqlite3.Cursor, table: str, output_path: Path, rows: Iterator[Sequence[str]]
+) -> list[str] | None:
+    """
+    Write ``rows`` (header first) to ``output_path`` and load them into ``table``
+    in the same pass. Returns the header, or None if nothing was loaded.
+    """
+    header = next(rows, None)
+    if header is None:
+        return None
 
-def write_sqlite_index(paths: dict[str, Path]) -> None:
+    with output_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter="\t")
+        writer.writerow(header)
+        if not header:
+            return None
+
+        header = list(header)
+        columns = ", ".join(f'"{h}" TEXT' for h in header)
+        placeholders = ", ".join("?" for _ in header)
+        cur.execute(f'DROP TABLE IF EXISTS "{table}"')
+        cur.execute(f'CREATE TABLE "{table}" ({columns})')
+        insert_sql = f'INSERT INTO "{table}" VALUES ({placeholders})'
+
+        writerow = writer.writerow
+        width = len(header)
+
+        def tee() -> Iterator[Sequence[str]]:
+            # Sources may be ragged (sparse XLSX rows, short text lines):
+            # give every row exactly one value per header column
+            for row in rows:
+                if len(row) != width:
+                    row = [*row[:width], *[""] * (width - len(row))]
+                writerow(row)
+                yield row
+
+        # All batches share the caller's transaction
+        for batch in batched(tee(), INSERT_BATCH_SIZE):
+            cur.executemany(insert_sql, batch)
+
+    return header
+
+
+def build_frequency_index() -> dict[str, Path]:
+    """Normalize every available source to TSV and load it into the SQLite index."""
     if SQLITE_PATH.exists():
         SQLITE_PATH.unlink()
 
-    conn = sqlite3.connect(SQLITE_PATH)
+    # Autocommit mode so the explicit BEGIN/COMMIT below is the only transaction
+    conn = sqlite3.connect(SQLITE_PATH, isolation_level=None)
     cur = conn.cursor()
+    for pragma in BULK_LOAD_PRAGMAS:
+        cur.execute(pragma)
 
-    def load_tsv(table: str, path: Path) -> None:
-        if path is None or not path.exists():
-            return
-
-        with path.open("r", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter="\t")
-            header = next(reader, None)
-            if not header:
-                return
-
-            columns = ", ".join(f'"{h}" TEXT' for h in header)
-            placeholders = ", ".join("?" for _ in header)
-            cur.execute(f'DROP TABLE IF EXISTS "{table}"')
-            cur.execute(f'CREATE TABLE "{table}" ({columns})')
-            cur.executemany(
-                f'INSERT INTO "{table}" VALUES ({placeholders})',
-                reader,
-            )
-
-    load_tsv("subtlex", paths.get("subtlex"))
-    load_tsv("multilex", paths.get("multilex"))
-    load_tsv("gpt_familiarity", paths.get("gpt_familiarity"))
-    load_tsv("gpt_affect", paths.get("gpt_affect"))
-    load_tsv("lemma40k", paths.get("lemma40k"))
-    load_tsv("form40k", paths.get("form40k"))
-    load_tsv("form200k", paths.get("form200k"))
-
-    conn.commit()
-    conn.close()
-
-
-def main() -> None:
     paths: dict[str, Path] = {}
+    loaded: dict[str, list[str]] = {}
 
-    paths["subtlex"] = normalize_subtlex()
-    paths["multilex"] = copy_simple_xlsx("Multilex_Spanish_word_frequency")
-    paths["gpt_familiarity"] = copy_simple_xlsx("GPT familiarity estimates Spanish words")
-    paths["gpt_affect"] = copy_simple_xlsx("GPT_estimates_valence_arousal_concreteness")
+    cur.execute("BEGIN")
+    for table, source_path, output_path, iter_rows in frequency_sources():
+        if not source_path.exists():
+            continue
+        header = stream_to_tsv_and_sqlite(cur, table, output_path, iter_rows(source_path))
+        if output_path.exists():
+            paths[table] = output_path
+        if header:
+            loaded[table] = header
+    cur.execute("COMMIT")
+
+    # Build lookup indexes in one pass over each finished table
+    cur.execute("BEGIN")
+    for table, header in loaded.items():
+        for column in LOOKUP_COLUMNS.get(table, ()):
+            if column in header:
+                cur.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{table}_{column.lower()}" '
+                    f'ON "{table}"(lower("{column}"))'
+                )
+    cur.execute("COMMIT")
+
+    # Leave the file in SQLite's default journal mode for readers
+    cur.execute("PRAGMA journal_mode = DELETE")
+    conn.close()
+    return paths
 
-    paths["lemma40k"] = normalize_spanish_frequency_text("span_40k_lemmas.txt", "spanish_lemmas_40k.tsv")
-    paths["form40k"] = normalize_spanish_frequency_text("span_40k_forms.txt", "spanish_forms_40k.tsv")
-    paths["form200k"] = normalize_spanish_frequency_text("span_200k.txt", "spanish_forms_200k.tsv")
 
-    write_sqlite_index(paths)
+def main() -> None:
+    paths = build_frequency_index()
 
     print("Frequency resources normalized:")
     for key, value in paths.items():
-        if value is None:
-            continue
         print(f" - {key}: {value.relative_to(BASE_DIR)}")
     print(f"SQLite index: {SQLITE_PATH.relative_to(BASE_DIR)}")
 
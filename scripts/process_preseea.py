@@ -18,8 +18,9 @@ from __future__ import annotations
 
 import csv
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 PRESEEA_DIR = BASE_DIR / "data" / "frequency" / "preseea"
@@ -27,7 +28,18 @@ OUTPUT_DIR = PRESEEA_DIR / "processed"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 TAG_RE = re.compile(r"<[^>]+>")
-TURN_RE = re.compile(r"^([A-ZÁÉÍÓÚÜÑ]{1,3}):\s*(.*)")
+# Speaker turns, matched over the whole file in one finditer pass;
+# [^\S\n] is whitespace that cannot run past the end of the line.
+LINE_RE = re.compile(r"^[^\S\n]*([A-ZÁÉÍÓÚÜÑ]{1,3}):[^\S\n]*(.*)", re.MULTILINE)
+
+AUDIO_RE = re.compile(r'<Trans[^>]*audio_filename="([^"]+)"')
+# The <Corpus> tag is matched once and its attributes read in a single pass
+CORPUS_RE = re.compile(r"<Corpus\b([^>]*)>")
+ATTR_RE = re.compile(r'([\w-]+)="([^"]*)"')
+CORPUS_FIELDS = (("subcorpus", "subcorpus"), ("ciudad", "city"), ("pais", "country"))
+HABLANTE_RE = re.compile(
+    r'<Hablante[^>]*nombre="([^"]+)"[^>]*codigo_hab="([A-Z])"[^>]*sexo="([^"]+)"[^>]*grupo_edad="([^"]+)"[^>]*edad="([^"]+)"[^>]*nivel_edu="([^"]+)"'
+)
 
 
 def clean_text(text: str) -> str:
@@ -39,27 +51,20 @@ def clean_text(text: str) -> str:
 def parse_metadata(content: str) -> Dict[str, str]:
     metadata: Dict[str, str] = {}
 
-    match = re.search(r'<Trans[^>]*audio_filename="([^"]+)"', content)
+    match = AUDIO_RE.search(content)
     if match:
         metadata["audio_filename"] = match.group(1)
 
-    match = re.search(r'<Corpus[^>]*subcorpus="([^"]+)"', content)
-    if match:
-        metadata["subcorpus"] = match.group(1)
-
-    match = re.search(r'<Corpus[^>]*ciudad="([^"]+)"', content)
+    match = CORPUS_RE.search(content)
     if match:
-        metadata["city"] = match.group(1)
-
-    match = re.search(r'<Corpus[^>]*pais="([^"]+)"', content)
-    if match:
-        metadata["country"] = match.group(1)
+        attrs = dict(ATTR_RE.findall(match.group(1)))
+        for attr, key in CORPUS_FIELDS:
+            value = attrs.get(attr)
+            if value:
+                metadata[key] = value
 
     # Participant metadata (first interviewer / interviewee entries)
-    speaker_matches = re.findall(
-        r'<Hablante[^>]*nombre="([^"]+)"[^>]*codigo_hab="([A-Z])"[^>]*sexo="([^"]+)"[^>]*grupo_edad="([^"]+)"[^>]*edad="([^"]+)"[^>]*nivel_edu="([^"]+)"',
-        content,
-    )
+    speaker_matches = HABLANTE_RE.findall(content)
     for name, code, sex, age_group, age, edu in speaker_matches:
         key_prefix = "interviewer" if code.upper() == "E" else "participant"
         metadata[f"{key_prefix}_id"] = name
@@ -71,26 +76,14 @@ def parse_metadata(content: str) -> Dict[str, str]:
     return metadata
 
 
-def extract_turns(path: Path, content: str) -> List[Dict[str, str]]:
-    turns: List[Dict[str, str]] = []
-    for line in content.splitlines():
-        line = line.strip()
-        if not line or line.startswith("<"):
-            continue
-
-        match = TURN_RE.match(line)
-        if not match:
-            continue
-
+def extract_turns(path: Path, content: str) -> List[Tuple[str, str, str, str]]:
+    """Return (file, speaker, raw, clean) tuples for each speaker turn."""
+    name = path.name
+    turns: List[Tuple[str, str, str, str]] = []
+    for match in LINE_RE.finditer(content):
         speaker, raw_text = match.groups()
-        turns.append(
-            {
-                "file": path.name,
-                "speaker": speaker,
-                "raw": raw_text,
-                "clean": clean_text(raw_text),
-            }
-        )
+        raw_text = raw_text.rstrip()
+        turns.append((name, speaker, raw_text, clean_text(raw_text)))
     return turns
 
 
@@ -117,12 +110,19 @@ def main() -> None:
         raise SystemExit("No PRESEEA transcripts found.")
 
     metadata_rows: List[Dict[str, str]] = []
-    turn_rows: List[Dict[str, str]] = []
 
-    for file_path in files:
-        metadata, turns = process_file(file_path)
-        metadata_rows.append(metadata)
-        turn_rows.extend(turns)
+    # Files are parsed in worker processes; map() yields results in input
+    # order, so turns are still written (and numbered) file by file.
+    with (OUTPUT_DIR / "turns.tsv").open("w", encoding="utf-8", newline="") as f, \
+            ProcessPoolExecutor() as executor:
+        writer = csv.writer(f, delimiter="\t")
+        writer.writerow(("file", "turn_index", "speaker", "raw", "clean"))
+        idx = 0
+        for metadata, turns in executor.map(process_file, files, chunksize=8):
+            metadata_rows.append(metadata)
+            for file_name, speaker, raw_text, clean in turns:
+                idx += 1
+                writer.writerow((file_name, idx, speaker, raw_text, clean))
 
     metadata_fields = sorted({key for row in metadata_rows for key in row.keys()})
     with (OUTPUT_DIR / "metadata.tsv").open("w", encoding="utf-8", newline="") as f:
@@ -130,21 +130,6 @@ def main() -> None:
         writer.writeheader()
         writer.writerows(metadata_rows)
 
-    with (OUTPUT_DIR / "turns.tsv").open("w", encoding="utf-8", newline="") as f:
-        fieldnames = ["file", "turn_index", "speaker", "raw", "clean"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter="\t")
-        writer.writeheader()
-        for idx, row in enumerate(turn_rows, start=1):
-            writer.writerow(
-                {
-                    "file": row["file"],
-                    "turn_index": idx,
-                    "speaker": row["speaker"],
-                    "raw": row["raw"],
-                    "clean": row["clean"],
-                }
-            )
-
     print(
         f"Processed {len(files)} transcripts -> "
         f"{OUTPUT_DIR / 'metadata.tsv'} and {OUTPUT_DIR / 'turns.tsv'}"
@@ -4,20 +4,29 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import yaml
 
+try:  # libyaml-backed loader is ~10x faster; same safe subset of YAML
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 SEED_DIR = BASE_DIR / "kg" / "seed"
 
+# Below this many files, process-pool startup costs more than it saves.
+PARALLEL_MIN_FILES = 500
+
 
 def load_yaml(path: Path) -> Dict:
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        return yaml.load(path.read_text(encoding="utf-8"), Loader=SafeLoader) or {}
     except UnicodeDecodeError:
-        return yaml.safe_load(path.read_text(encoding="latin-1")) or {}
+        return yaml.load(path.read_text(encoding="latin-1"), Loader=SafeLoader) or {}
 
 
 def check_required_metadata(node: Dict, warnings: List[str], path: Path) -> None:
@@ -94,6 +103,11 @@ def validate_node(path: Path) -> Tuple[List[str], Dict]:
     return warnings, node
 
 
+def node_warnings(path: Path) -> List[str]:
+    """Validate one seed file, returning only its warnings (cheap to pickle)."""
+    return validate_node(path)[0]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate KG seed files")
     parser.add_argument(
@@ -104,12 +118,16 @@ def main() -> None:
     args = parser.parse_args()
 
     all_warnings: List[str] = []
-    total = 0
+    paths = sorted(SEED_DIR.glob("*.yaml"))
+    total = len(paths)
 
-    for path in sorted(SEED_DIR.glob("*.yaml")):
-        total += 1
-        warnings, _ = validate_node(path)
-        all_warnings.extend(warnings)
+    if total >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            for warnings in executor.map(node_warnings, paths, chunksize=16):
+                all_warnings.extend(warnings)
+    else:
+        for path in paths:
+            all_warnings.extend(node_warnings(path))
 
     print(f"Validated {total} seed files.")
     if all_warnings:
@@ -43,29 +43,26 @@ DEFAULT_EDGE_COLOR = "#95A5A6"  # Gray for unknown types
 def load_graph(db_path: str) -> nx.DiGraph:
     """Load KG from SQLite into NetworkX directed graph."""
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
     G = nx.DiGraph()
 
-    # Load nodes with attributes
-    cursor.execute("SELECT node_id, type, label, cefr_level FROM nodes")
-    for row in cursor:
-        G.add_node(
-            row["node_id"],
-            type=row["type"],
-            label=row["label"],
-            cefr_level=row["cefr_level"] or "unspecified"
+    # Load nodes with attributes in one bulk call (plain tuples, no Row objects)
+    rows = cursor.execute("SELECT node_id, type, label, cefr_level FROM nodes").fetchall()
+    G.add_nodes_from(
+        (
+            node_id,
+            {"type": node_type, "label": label, "cefr_level": cefr or "unspecified"},
         )
+        for node_id, node_type, label, cefr in rows
+    )
 
-    # Load edges with attributes
-    cursor.execute("SELECT source_id, target_id, edge_type FROM edges")
-    for row in cursor:
-        G.add_edge(
-            row["source_id"],
-            row["target_id"],
-            relation=row["edge_type"]
-        )
+    # Load edges with attributes in one bulk call
+    rows = cursor.execute("SELECT source_id, target_id, edge_type FROM edges").fetchall()
+    G.add_edges_from(
+        (source, target, {"relation": relation})
+        for source, target, relation in rows
+    )
 
     conn.close()
     return G
@@ -84,6 +81,19 @@ def filter_graph(
         if neighborhood not in G:
             print(f"Warning: Node '{neighborhood}' not found in graph")
             return nx.DiGraph()
+        if depth <= 2:
+            # Small radii: walk the successor dicts directly rather than
+            # going through ego_graph's generic shortest-path machinery
+            succ = G.succ
+            nodes = {neighborhood}
+            frontier = {neighborhood}
+            for _ in range(depth):
+                reached = set()
+                for n in frontier:
+                    reached.update(succ[n])
+                frontier = reached - nodes
+                nodes |= frontier
+            return G.subgraph(nodes).copy()
         return nx.ego_graph(G, neighborhood, radius=depth, undirected=False)
 
     nodes_to_keep = set(G.nodes())
@@ -163,8 +173,7 @@ def generate_html(G: nx.DiGraph, output_path: str, hierarchical: bool = False):
         "AssessmentCriterion": "#8E44AD", # Dark Purple
     }
 
-    for node in G.nodes():
-        node_data = G.nodes[node]
+    for node, node_data in G.nodes(data=True):
         node_type = node_data.get("type", "Unknown")
         label = node_data.get("label", node)
         cefr = node_data.get("cefr_level", "?")
@@ -211,12 +220,13 @@ def generate_png(G: nx.DiGraph, output_path: str, hierarchical_cefr: bool = Fals
         # Group nodes by CEFR level for vertical layering
         cefr_levels = ["A1", "A2", "B1", "B2", "C1", "C2", "unspecified"]
         pos = {}
+        nodes_by_level: dict[str, list] = {level: [] for level in cefr_levels}
+        for n, node_data in G.nodes(data=True):
+            nodes_at_level = nodes_by_level.get(node_data.get("cefr_level", "unspecified"))
+            if nodes_at_level is not None:
+                nodes_at_level.append(n)
         for level_idx, level in enumerate(cefr_levels):
-            nodes_at_level = [
-                n for n in G.nodes()
-                if G.nodes[n].get("cefr_level", "unspecified") == level
-            ]
-            for node_idx, node in enumerate(nodes_at_level):
+            for node_idx, node in enumerate(nodes_by_level[level]):
                 pos[node] = (node_idx * 2, -level_idx * 2)  # Spread horizontally, layer vertically
         pos = nx.spring_layout(G, pos=pos, fixed=pos.keys(), k=0.5, iterations=50)
     else:
@@ -240,8 +250,7 @@ def generate_png(G: nx.DiGraph, output_path: str, hierarchical_cefr: bool = Fals
         "AssessmentCriterion": "mediumpurple",
     }
 
-    for node in G.nodes():
-        node_data = G.nodes[node]
+    for node, node_data in G.nodes(data=True):
         node_type = node_data.get("type", "Unknown")
         label = node_data.get("label", node)
         cefr = node_data.get("cefr_level", "?")
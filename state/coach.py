@@ -14,21 +14,294 @@ Reference: STRATEGY.md "Hybrid Architecture: LLM + Atomic Tools"
 """
 
 import json
+import secrets
 import sqlite3
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from uuid import uuid4
 
 import yaml
 
-from state.fsrs import DEFAULT_W, ReviewCard, review_card
+from state.fsrs import DEFAULT_W, ReviewCard, calculate_next_review_date, review_card_kernel
 from state.session_planner import (
     DEFAULT_MASTERY_CRITERIA,
+    SessionPlan,
     SessionPlanner,
     StrandBalance,
 )
 
+# Applied once to the Coach's long-lived mastery connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+# Fixed strand order for weight vectors
+STRAND_NAMES = ("meaning_input", "meaning_output", "language_focused", "fluency")
+STRAND_INDEX = {strand: index for index, strand in enumerate(STRAND_NAMES)}
+
+# adjust_focus() goal heuristics, in priority order: the first recipe with any
+# keyword in the goal sets the strand weights
+FOCUS_RECIPES: tuple[tuple[tuple[str, ...], dict[str, float]], ...] = (
+    (("travel", "trip", "vacation", "booking", "hotel", "restaurant"),
+     {"meaning_output": 2.0, "meaning_input": 1.5}),  # Transactional functions + comprehension
+    (("grammar", "correct", "accuracy", "mistakes", "rules"),
+     {"language_focused": 2.5, "meaning_output": 0.5}),  # Less focus on free production
+    (("fluent", "fluency", "speed", "automatic", "faster"),
+     {"fluency": 2.5, "meaning_output": 1.5, "language_focused": 0.5}),
+    (("understand", "listening", "comprehension", "podcast", "movie"),
+     {"meaning_input": 2.5, "meaning_output": 0.8}),
+    (("speak", "speaking", "conversation", "talk", "communicate"),
+     {"meaning_output": 2.5, "meaning_input": 1.2}),
+    (("write", "writing", "email", "letter", "essay"),
+     {"meaning_output": 2.0, "language_focused": 1.5}),
+)
+# Each recipe as a full weight vector in STRAND_NAMES order (unlisted strands 1.0)
+FOCUS_RECIPE_WEIGHTS = tuple(
+    tuple(overrides.get(strand, 1.0) for strand in STRAND_NAMES) for _, overrides in FOCUS_RECIPES
+)
+FOCUS_RECIPE_WORDS = tuple(words for words, _ in FOCUS_RECIPES)
+
+# Seconds one recorded exercise adds to the strand_balance_recent view: its
+# review_history row counts 60s, plus the strand-table row (fluency rows count
+# their actual duration; language_focused has no strand table). Keep in step
+# with the view in state/schema.sql and migrations/001_four_strands.sql.
+REVIEW_HISTORY_SECONDS = 60
+STRAND_LOG_SECONDS = {"meaning_input": 120, "meaning_output": 60}
+
+# Preview plans are kept this long (and for at most this many learners)
+PREVIEW_TTL_NS = 5 * 60 * 1_000_000_000
+PREVIEW_CACHE_MAX = 1024
+
+# items.last_review_ms is in epoch milliseconds; FSRS counts elapsed days
+MS_PER_DAY = 86_400_000
+
+# Well above the number of statements below, so none is evicted and re-prepared
+STATEMENT_CACHE_SIZE = 256
+
+# Item state read by record_exercise, followed by the item's review-quality
+# totals: kept on items since migration 007 (FETCH_ITEM_SQL), summed from
+# review_history before that (FETCH_ITEM_HISTORY_SQL)
+ITEM_STATE_COLUMNS = """
+        i.item_id, i.stability, i.difficulty, i.reps,
+        i.last_review, i.last_review_ms, i.mastery_status"""
+
+FETCH_ITEM_SQL = f"""
+    SELECT{ITEM_STATE_COLUMNS},
+        i.quality_sum, i.review_count
+    FROM items i
+    WHERE i.item_id = ?1
+"""
+
+FETCH_ITEM_HISTORY_SQL = f"""
+    SELECT{ITEM_STATE_COLUMNS},
+        h.quality_sum, h.review_count
+    FROM (
+        SELECT SUM(quality) AS quality_sum, COUNT(*) AS review_count
+        FROM review_history
+        WHERE item_id = ?1
+    ) h
+    LEFT JOIN items i ON i.item_id = ?1
+"""
+
+# What a fetch means for an item that has no items row yet
+NEW_ITEM_ROW = (None, None, None, None, None, None, None, None, 0)
+
+# The fetch for every item in a session plan, keyed by the planned item_id;
+# fill in one "(?)" row per item_id before executing
+PRELOAD_ITEMS_SQL = f"""
+    WITH planned(item_id) AS (VALUES {{item_ids}})
+    SELECT
+        p.item_id,{ITEM_STATE_COLUMNS},
+        i.quality_sum, COALESCE(i.review_count, 0)
+    FROM planned p
+    LEFT JOIN items i ON i.item_id = p.item_id
+"""
+
+PRELOAD_ITEMS_HISTORY_SQL = f"""
+    WITH planned(item_id) AS (VALUES {{item_ids}})
+    SELECT
+        p.item_id,{ITEM_STATE_COLUMNS},
+        h.quality_sum, COALESCE(h.review_count, 0)
+    FROM planned p
+    LEFT JOIN items i ON i.item_id = p.item_id
+    LEFT JOIN (
+        SELECT item_id, SUM(quality) AS quality_sum, COUNT(*) AS review_count
+        FROM review_history
+        WHERE item_id IN (SELECT item_id FROM planned)
+        GROUP BY item_id
+    ) h ON h.item_id = p.item_id
+"""
+
+UPSERT_ITEM_TEMPLATE = """
+    INSERT INTO items (
+        item_id, node_id, type, last_review, stability, difficulty, reps,
+        primary_strand, mastery_status, last_mastery_check{columns}
+    )
+    VALUES (
+        :item_id, :node_id, :type, :last_review, :stability, :difficulty, :reps,
+        :primary_strand, :mastery_status, :last_mastery_check{values}
+    )
+    ON CONFLICT(item_id) DO UPDATE SET
+        last_review = excluded.last_review,
+        stability = excluded.stability,
+        difficulty = excluded.difficulty,
+        reps = excluded.reps,
+        primary_strand = excluded.primary_strand,
+        mastery_status = excluded.mastery_status,
+        last_mastery_check = excluded.last_mastery_check{updates}
+"""
+
+# items columns added by later migrations, and how an upsert updates each
+ITEM_OPTIONAL_UPDATES = {
+    "last_review_ms": "excluded.last_review_ms",  # 006
+    "quality_sum": "quality_sum + excluded.quality_sum",  # 007
+    "review_count": "review_count + excluded.review_count",  # 007
+}
+
+
+def item_sql(columns: set[str]) -> tuple[str, str, str]:
+    """Fetch, preload and upsert SQL for an items table with these columns.
+
+    Databases without migration 006 read a NULL last_review_ms; those
+    without migration 007 sum review totals from review_history.
+    """
+    if "review_count" in columns:
+        fetch, preload = FETCH_ITEM_SQL, PRELOAD_ITEMS_SQL
+    else:
+        fetch, preload = FETCH_ITEM_HISTORY_SQL, PRELOAD_ITEMS_HISTORY_SQL
+    if "last_review_ms" not in columns:
+        fetch = fetch.replace("i.last_review_ms", "NULL")
+        preload = preload.replace("i.last_review_ms", "NULL")
+
+    optional = [column for column in ITEM_OPTIONAL_UPDATES if column in columns]
+    upsert = UPSERT_ITEM_TEMPLATE.format(
+        columns="".join(f", {column}" for column in optional),
+        values="".join(f", :{column}" for column in optional),
+        updates="".join(
+            f",\n        {column} = {ITEM_OPTIONAL_UPDATES[column]}" for column in optional
+        ),
+    )
+    return fetch, preload, upsert
+
+
+INSERT_REVIEW_SQL = """
+    INSERT INTO review_history (
+        item_id, review_time, quality,
+        stability_before, stability_after,
+        difficulty_before, difficulty_after,
+        strand, exercise_type
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Append one "(?, ?)" row per (skill, next_level) target before executing
+COUNT_LEVEL_PROGRESS_SQL = """
+    WITH targets(skill, cefr_level) AS (VALUES {targets})
+    SELECT
+        i.skill,
+        COUNT(*) as total,
+        SUM(i.mastery_status IN ('mastered', 'fluency_ready')) as mastered
+    FROM targets t
+    JOIN items i ON i.skill = t.skill
+    JOIN kg.nodes n ON n.node_id = i.node_id AND n.cefr_level = t.cefr_level
+    GROUP BY i.skill
+"""
+
+LOAD_SESSION_SQL = """
+    SELECT session_id, learner_id, start_time, duration_target_min, exercises_completed
+    FROM sessions
+    WHERE session_id = ?
+"""
+
+CREATE_SESSIONS_SQL = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        learner_id TEXT NOT NULL,
+        start_time TIMESTAMP NOT NULL,
+        end_time TIMESTAMP,
+        duration_target_min INTEGER,
+        duration_actual_min REAL,
+        exercises_completed INTEGER DEFAULT 0
+    )
+"""
+
+INSERT_SESSION_SQL = """
+    INSERT INTO sessions (session_id, learner_id, start_time, duration_target_min)
+    VALUES (?, ?, ?, ?)
+"""
+
+END_SESSION_SQL = """
+    UPDATE sessions
+    SET end_time = ?, exercises_completed = ?, duration_actual_min = ?
+    WHERE session_id = ?
+"""
+
+INSERT_SESSION_LOG_SQL = """
+    INSERT INTO session_log (
+        session_id, learner_id, started_at, ended_at,
+        duration_target_min, duration_actual_min,
+        exercises_planned, exercises_completed,
+        strand_mi_pct, strand_mo_pct, strand_lf_pct, strand_fl_pct,
+        balance_status, quality_avg, mastery_changes,
+        negotiated_weights, approved_plan, notes
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_MEANING_INPUT_SQL = """
+    INSERT INTO meaning_input_log (
+        node_id, item_id, session_date, comprehension_quality,
+        understood_key_points, required_repetitions, task_type, notes
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_MEANING_OUTPUT_SQL = """
+    INSERT INTO meaning_output_log (
+        node_id, item_id, session_date, communication_successful,
+        quality, errors_noted, required_clarification, task_type, notes
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_FLUENCY_SQL = """
+    INSERT INTO fluency_metrics (
+        item_id, session_date, duration_seconds, output_word_count,
+        words_per_minute, pause_count, hesitation_markers,
+        baseline_wpm, improvement_pct, smoothness, improvement_feel, notes
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def match_focus_recipe(goal_lower: str) -> int | None:
+    """Index of the first FOCUS_RECIPES entry with a keyword in the goal, if any."""
+    # Plain substring tests: str.__contains__ outruns a regex alternation here
+    for index, words in enumerate(FOCUS_RECIPE_WORDS):
+        for word in words:
+            if word in goal_lower:
+                return index
+    return None
+
+
+def new_session_id() -> str:
+    """
+    Generate a time-ordered session ID.
+
+    64 bits: the millisecond timestamp above 22 random bits, as 16 hex digits.
+    Shorter than a UUID string, and new IDs sort after older ones, so inserts
+    land at the end of the sessions/session_log primary-key indexes.
+    """
+    return f"{(time.time_ns() // 1_000_000) << 22 | secrets.randbits(22):016x}"
+
 
 @dataclass
 class SessionInfo:
@@ -46,6 +319,9 @@ class SessionInfo:
     total_quality: float = 0.0  # Sum of quality scores (for averaging)
     negotiated_weights: dict[str, float] | None = None  # Strand preference weights
     approved_plan: list[dict] | None = None  # List of approved exercises from preview
+    item_cache: dict[str, tuple] = field(default_factory=dict)  # Preloaded item rows (see PRELOAD_ITEMS_SQL)
+    negotiated_weights_json: str | None = None  # negotiated_weights serialized once at start
+    approved_plan_json: str | None = None  # approved_plan serialized once at start
 
 
 @dataclass
@@ -76,7 +352,8 @@ class Coach:
         self,
         kg_db_path: Path | None = None,
         mastery_db_path: Path | None = None,
-        mastery_criteria: dict | None = None
+        mastery_criteria: dict | None = None,
+        batch_size: int = 1
     ):
         """
         Initialize coaching tools.
@@ -85,10 +362,20 @@ class Coach:
             kg_db_path: Path to knowledge graph database
             mastery_db_path: Path to mastery database
             mastery_criteria: Custom mastery thresholds (optional)
+            batch_size: Exercises recorded per commit (default: 1, commit each).
+                Larger values keep the write transaction open between
+                exercises until the batch fills, flush() or end_session().
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         self.kg_db_path = kg_db_path or Path(__file__).parent.parent / "kg.sqlite"
         self.mastery_db_path = mastery_db_path or Path(__file__).parent / "mastery.sqlite"
         self.mastery_criteria = mastery_criteria or DEFAULT_MASTERY_CRITERIA
+        # Thresholds read by _assess_mastery() on every exercise
+        self._mastery_stability_days = self.mastery_criteria["stability_days"]
+        self._mastery_min_reps = self.mastery_criteria["min_reps"]
+        self._mastery_avg_quality = self.mastery_criteria["avg_quality"]
 
         self.planner = SessionPlanner(
             kg_db_path=self.kg_db_path,
@@ -99,10 +386,88 @@ class Coach:
         # Active sessions (session_id -> SessionInfo)
         self.active_sessions: dict[str, SessionInfo] = {}
 
-        # Cached preview plans (learner_id -> (plan, timestamp))
+        # One connection for the Coach's lifetime; the lock serializes its use
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._kg_attached = False
+
+        # Exercises written but not yet committed (see batch_size)
+        self._batch_size = batch_size
+        self._pending_exercises = 0
+
+        # Cached preview plans (learner_id -> (plan, monotonic deadline in ns))
         # TTL: 5 minutes - prevents plan drift between preview and start
-        self._preview_cache: dict[str, tuple[dict, datetime]] = {}
-        self._preview_ttl_minutes = 5
+        # Bounded LRU: the least recently previewed learner is evicted first
+        self._preview_cache: OrderedDict[str, tuple[dict, int]] = OrderedDict()
+        self._preview_ttl_ns = PREVIEW_TTL_NS
+
+        # strand_balance_recent as (UTC day it was read, seconds by strand,
+        # (day, strand) groups), advanced in memory by each recorded exercise
+        # instead of re-aggregating the view. The view covers every learner,
+        # so one cache serves all sessions; dropped at session end
+        self._balance_cache: tuple[str, dict[str, float], set[tuple[str, str]]] | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the mastery database connection, apply CONNECTION_PRAGMAS and pick the item SQL."""
+        # Autocommit mode: writers issue their own BEGIN IMMEDIATE / COMMIT
+        conn = sqlite3.connect(
+            self.mastery_db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+        # The sessions table belongs to the coach; create it once per connection
+        conn.execute(CREATE_SESSIONS_SQL)
+
+        # Write the item columns added by migrations 006 and 007 when present
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(items)")}
+        self._fetch_item_sql, self._preload_items_sql, self._upsert_item_sql = item_sql(columns)
+        return conn
+
+    def _attach_kg(self) -> None:
+        """Attach the knowledge graph database as ``kg`` (once per connection)."""
+        if not self._kg_attached:
+            self._conn.execute("ATTACH DATABASE ? AS kg", (str(self.kg_db_path),))
+            self._kg_attached = True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run the body atomically on the shared connection.
+
+        Uses its own BEGIN IMMEDIATE transaction, or a savepoint inside an
+        exercise batch that is still open.
+        """
+        with self._lock:
+            conn = self._conn
+            outer = not conn.in_transaction
+            conn.execute("BEGIN IMMEDIATE" if outer else "SAVEPOINT coach_write")
+            try:
+                yield conn.cursor()
+            except BaseException:
+                if outer:
+                    conn.execute("ROLLBACK")
+                else:
+                    conn.execute("ROLLBACK TO coach_write")
+                    conn.execute("RELEASE coach_write")
+                raise
+            conn.execute("COMMIT" if outer else "RELEASE coach_write")
+
+    def flush(self) -> None:
+        """Commit exercises still pending in the current batch."""
+        with self._lock:
+            if self._conn.in_transaction:
+                self._conn.execute("COMMIT")
+            self._pending_exercises = 0
+
+    def close(self) -> None:
+        """Commit any pending exercises and close the mastery database connection."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
 
     def preview_session(
         self,
@@ -126,47 +491,31 @@ class Coach:
             Dictionary with exercises, balance status, notes (no session_id)
         """
         # Generate session plan
-        plan = self.planner.plan_session(
-            learner_id=learner_id,
-            duration_minutes=duration_minutes,
-            learner_preference=learner_preference
-        )
+        with self._lock:
+            plan = self.planner.plan_session(
+                learner_id=learner_id,
+                duration_minutes=duration_minutes,
+                learner_preference=learner_preference,
+                conn=self._conn
+            )
 
         # Build response
-        response = {
-            "exercises": [
-                {
-                    "strand": ex.strand,
-                    "node_id": ex.node_id,
-                    "item_id": ex.item_id,
-                    "exercise_type": ex.exercise_type,
-                    "duration_estimate_min": ex.duration_estimate_min,
-                    "instructions": ex.instructions
-                }
-                for ex in plan.exercises
-            ],
-            "total_exercises": len(plan.exercises),
-            "balance_status": plan.balance_status,
-            "current_balance": {
-                "meaning_input": f"{plan.strand_balance.meaning_input * 100:.1f}%",
-                "meaning_output": f"{plan.strand_balance.meaning_output * 100:.1f}%",
-                "language_focused": f"{plan.strand_balance.language_focused * 100:.1f}%",
-                "fluency": f"{plan.strand_balance.fluency * 100:.1f}%"
-            },
-            "notes": plan.notes,
-            "llm_guidance": self._generate_session_guidance(plan)
-        }
+        response = self._plan_response(plan)
 
         # Cache the plan for 5 minutes to prevent drift
-        # Store plan object + negotiated preferences + timestamp
-        self._preview_cache[learner_id] = (
+        # Store plan object + negotiated preferences + expiry deadline
+        cache = self._preview_cache
+        cache[learner_id] = (
             {
                 "plan": plan,
                 "duration_minutes": duration_minutes,
                 "learner_preference": learner_preference
             },
-            datetime.now(UTC)
+            time.monotonic_ns() + self._preview_ttl_ns
         )
+        cache.move_to_end(learner_id)
+        if len(cache) > PREVIEW_CACHE_MAX:
+            cache.popitem(last=False)
 
         return response
 
@@ -196,58 +545,28 @@ class Coach:
         """
         goal_lower = goal_description.lower()
 
-        # Default: equal weights
-        weights = {
-            "meaning_input": 1.0,
-            "meaning_output": 1.0,
-            "language_focused": 1.0,
-            "fluency": 1.0
-        }
-
-        # Goal-based heuristics
-        if any(word in goal_lower for word in ["travel", "trip", "vacation", "booking", "hotel", "restaurant"]):
-            weights["meaning_output"] = 2.0  # Transactional functions
-            weights["meaning_input"] = 1.5   # Comprehension
-
-        elif any(word in goal_lower for word in ["grammar", "correct", "accuracy", "mistakes", "rules"]):
-            weights["language_focused"] = 2.5
-            weights["meaning_output"] = 0.5  # Less focus on free production
+        # Goal-based heuristics: the first recipe with a keyword in the goal wins
+        recipe = match_focus_recipe(goal_lower)
 
-        elif any(word in goal_lower for word in ["fluent", "fluency", "speed", "automatic", "faster"]):
-            weights["fluency"] = 2.5
-            weights["meaning_output"] = 1.5
-            weights["language_focused"] = 0.5
-
-        elif any(word in goal_lower for word in ["understand", "listening", "comprehension", "podcast", "movie"]):
-            weights["meaning_input"] = 2.5
-            weights["meaning_output"] = 0.8
-
-        elif any(word in goal_lower for word in ["speak", "speaking", "conversation", "talk", "communicate"]):
-            weights["meaning_output"] = 2.5
-            weights["meaning_input"] = 1.2
-
-        elif any(word in goal_lower for word in ["write", "writing", "email", "letter", "essay"]):
-            weights["meaning_output"] = 2.0
-            weights["language_focused"] = 1.5
+        # Weight vector in STRAND_NAMES order; default is equal weights
+        weights = list(FOCUS_RECIPE_WEIGHTS[recipe]) if recipe is not None else [1.0] * 4
 
         # If current balance provided, reduce weights for over-represented strands
         if current_balance:
             for strand, percentage in current_balance.items():
                 if percentage > 0.35:  # Over 35%
-                    weights[strand] *= 0.5  # Reduce emphasis
+                    weights[STRAND_INDEX[strand]] *= 0.5  # Reduce emphasis
 
         # Bound weights to [0, 2.0] range
-        for strand in weights:
-            weights[strand] = max(0.0, min(2.0, weights[strand]))
+        weights = [max(0.0, min(2.0, w)) for w in weights]
 
         # Normalize weights to sum to 4.0 (average of 1.0 per strand)
-        total = sum(weights.values())
+        total = sum(weights)
         if total > 0:
             scale_factor = 4.0 / total
-            for strand in weights:
-                weights[strand] *= scale_factor
+            weights = [w * scale_factor for w in weights]
 
-        return weights
+        return dict(zip(STRAND_NAMES, weights, strict=True))
 
     def start_session(
         self,
@@ -273,30 +592,34 @@ class Coach:
         """
         # Check if we have a cached preview plan within TTL
         plan = None
-        if learner_id in self._preview_cache:
-            cached_data, cached_time = self._preview_cache[learner_id]
-            age_minutes = (datetime.now(UTC) - cached_time).total_seconds() / 60
+        cached = self._preview_cache.get(learner_id)
+        if cached is not None:
+            cached_data, deadline = cached
 
             # Use cached plan if:
             # 1. TTL not exceeded
             # 2. Parameters match (duration, preferences)
-            if age_minutes <= self._preview_ttl_minutes:
-                if (cached_data["duration_minutes"] == duration_minutes and
-                    cached_data["learner_preference"] == learner_preference):
-                    plan = cached_data["plan"]
-                    # Clear cache after use
-                    del self._preview_cache[learner_id]
+            if deadline < time.monotonic_ns():
+                # Expired: drop it rather than keep it around until evicted
+                del self._preview_cache[learner_id]
+            elif (cached_data["duration_minutes"] == duration_minutes and
+                  cached_data["learner_preference"] == learner_preference):
+                plan = cached_data["plan"]
+                # Clear cache after use
+                del self._preview_cache[learner_id]
 
         # Generate new plan if no valid cache
         if plan is None:
-            plan = self.planner.plan_session(
-                learner_id=learner_id,
-                duration_minutes=duration_minutes,
-                learner_preference=learner_preference
-            )
+            with self._lock:
+                plan = self.planner.plan_session(
+                    learner_id=learner_id,
+                    duration_minutes=duration_minutes,
+                    learner_preference=learner_preference,
+                    conn=self._conn
+                )
 
         # Create session record
-        session_id = str(uuid4())
+        session_id = new_session_id()
 
         # Extract approved plan for audit trail
         approved_plan_data = [
@@ -308,10 +631,11 @@ class Coach:
             for ex in plan.exercises
         ]
 
+        start_time = datetime.now(UTC)
         session_info = SessionInfo(
             session_id=session_id,
             learner_id=learner_id,
-            start_time=datetime.now(UTC),
+            start_time=start_time,
             duration_target_minutes=duration_minutes,
             exercises_completed=0,
             exercises_remaining=len(plan.exercises),
@@ -319,38 +643,20 @@ class Coach:
             current_strand_balance=plan.strand_balance,
             session_notes=plan.notes,
             negotiated_weights=learner_preference,  # Store negotiated preferences
-            approved_plan=approved_plan_data  # Store approved exercises
+            approved_plan=approved_plan_data,  # Store approved exercises
+            item_cache=self._preload_items(approved_plan_data),
+            # Neither changes during the session, so the audit-trail JSON
+            # for _log_session_end is built now rather than at the end
+            negotiated_weights_json=json.dumps(learner_preference) if learner_preference else None,
+            approved_plan_json=json.dumps(approved_plan_data) if approved_plan_data else None
         )
 
         self.active_sessions[session_id] = session_info
 
         # Log session start
-        self._log_session_start(session_id, learner_id, duration_minutes)
+        self._log_session_start(session_id, learner_id, start_time, duration_minutes)
 
-        return {
-            "session_id": session_id,
-            "exercises": [
-                {
-                    "strand": ex.strand,
-                    "node_id": ex.node_id,
-                    "item_id": ex.item_id,
-                    "exercise_type": ex.exercise_type,
-                    "duration_estimate_min": ex.duration_estimate_min,
-                    "instructions": ex.instructions
-                }
-                for ex in plan.exercises
-            ],
-            "total_exercises": len(plan.exercises),
-            "balance_status": plan.balance_status,
-            "current_balance": {
-                "meaning_input": f"{plan.strand_balance.meaning_input * 100:.1f}%",
-                "meaning_output": f"{plan.strand_balance.meaning_output * 100:.1f}%",
-                "language_focused": f"{plan.strand_balance.language_focused * 100:.1f}%",
-                "fluency": f"{plan.strand_balance.fluency * 100:.1f}%"
-            },
-            "notes": plan.notes,
-            "llm_guidance": self._generate_session_guidance(plan)
-        }
+        return {"session_id": session_id, **self._plan_response(plan)}
 
     def record_exercise(
         self,
@@ -394,110 +700,69 @@ class Coach:
 
         session = self.active_sessions[session_id]
 
-        conn = sqlite3.connect(self.mastery_db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn
+        self._lock.acquire()
+        in_savepoint = False
 
         try:
             cursor = conn.cursor()
-
-            # 1. Get or create item
-            cursor.execute("SELECT * FROM items WHERE item_id = ?", (item_id,))
-            row = cursor.fetchone()
-
-            if row:
-                # Existing item - update FSRS
-                current_card = ReviewCard(
-                    stability=row["stability"] or 0.0,
-                    difficulty=row["difficulty"] or 5.0,
-                    reps=row["reps"] or 0,
-                    last_review=datetime.fromisoformat(row["last_review"]) if row["last_review"] else None
-                )
-                old_mastery_status = row["mastery_status"]
-            else:
-                # New item - initialize
-                current_card = ReviewCard(
-                    stability=0.0,
-                    difficulty=5.0,
-                    reps=0,
-                    last_review=None
-                )
-                old_mastery_status = "new"
-
-            # 2. Update FSRS parameters
+            # One transaction (and one journal sync) for every write below;
+            # with batch_size > 1 it stays open across several exercises,
+            # and the savepoint lets a failure undo just this one
+            if not conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SAVEPOINT record_exercise")
+            in_savepoint = True
+
+            # 1. Get or create item, along with its review-quality totals so
+            # the mastery check below needs no further reads
+            row = self._fetch_item(cursor, session, item_id)
+
+            # 2. Update FSRS parameters on the raw row values
             review_time = datetime.now(UTC)
-            updated_card, review_result = review_card(
-                current_card,
-                quality,
-                review_time=review_time,
-                w=DEFAULT_W
+            review_time_ms = int(review_time.timestamp() * 1000)
+            updated_card, old_stability, old_difficulty = self._review_item(
+                row, quality, review_time, review_time_ms
             )
 
-            # 3. Update or insert item
-            # Extract node_id from item_id (e.g., "card.es.ser_vs_estar.001" → "card.es.ser_vs_estar")
-            node_id = ".".join(item_id.split(".")[:-1]) if "." in item_id else item_id
+            # 3. Check mastery status, counting the review being recorded
+            new_status, mastery_changed = self._update_mastery_status(row, updated_card, quality)
 
-            cursor.execute("""
-                INSERT INTO items (
-                    item_id, node_id, type, last_review, stability, difficulty, reps,
-                    primary_strand, mastery_status, last_mastery_check
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(item_id) DO UPDATE SET
-                    last_review = excluded.last_review,
-                    stability = excluded.stability,
-                    difficulty = excluded.difficulty,
-                    reps = excluded.reps,
-                    primary_strand = excluded.primary_strand,
-                    last_mastery_check = excluded.last_mastery_check
-            """, (
-                item_id,
-                node_id,
-                exercise_type,
-                review_time.isoformat(),
-                updated_card.stability,
-                updated_card.difficulty,
-                updated_card.reps,
-                strand,
-                old_mastery_status,  # Will be updated by mastery check
-                review_time.isoformat()
-            ))
+            # 4. Update or insert item (FSRS parameters and mastery status together),
+            # with one timestamp for every row this exercise writes
+            review_time_iso = review_time.isoformat()
+            review_date = review_time_iso[:10]
+            node_id = self._upsert_item(
+                cursor, item_id, exercise_type, strand, quality,
+                updated_card, new_status, review_time_iso, review_time_ms
+            )
 
-            # 4. Log to review_history
-            cursor.execute("""
-                INSERT INTO review_history (
-                    item_id, review_time, quality,
-                    stability_before, stability_after,
-                    difficulty_before, difficulty_after,
-                    strand, exercise_type
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            # 5. Log to review_history
+            cursor.execute(INSERT_REVIEW_SQL, (
                 item_id,
-                review_time.isoformat(),
+                review_time_iso,
                 quality,
-                current_card.stability,
+                old_stability,
                 updated_card.stability,
-                current_card.difficulty,
+                old_difficulty,
                 updated_card.difficulty,
                 strand,
                 exercise_type
             ))
 
-            # 5. Log to strand-specific table
+            # 6. Log to strand-specific table
             self._log_to_strand_table(
                 cursor,
                 strand,
                 item_id,
+                node_id,
                 session_id,
+                review_date,
                 quality,
                 duration_seconds,
                 learner_response
             )
 
-            # 6. Check mastery status
-            old_status, new_status = self._check_mastery_status(cursor, item_id)
-            mastery_changed = old_status != new_status
-
             # 7. Update session progress
             session.exercises_completed += 1
             session.exercises_remaining -= 1
@@ -505,10 +770,14 @@ class Coach:
             if mastery_changed:
                 session.mastery_changes += 1
 
-            conn.commit()
+            cursor.execute("RELEASE record_exercise")
+            in_savepoint = False
+            self._pending_exercises += 1
+            if self._pending_exercises >= self._batch_size:
+                self.flush()
 
             # 8. Get updated strand balance
-            balance = self.planner.get_strand_balance(session.learner_id)
+            balance = self._advance_strand_balance(strand, review_date, duration_seconds)
 
             # 9. Generate feedback for LLM
             feedback = self._generate_exercise_feedback(
@@ -523,7 +792,9 @@ class Coach:
                 success=True,
                 item_id=item_id,
                 quality=quality,
-                next_review_date=review_result.next_review_date.isoformat(),
+                next_review_date=calculate_next_review_date(
+                    updated_card.stability, review_time
+                ).isoformat(),
                 new_stability=updated_card.stability,
                 new_difficulty=updated_card.difficulty,
                 mastery_status=new_status,
@@ -539,11 +810,15 @@ class Coach:
             )
 
         except Exception as e:
-            conn.rollback()
+            if in_savepoint:
+                conn.execute("ROLLBACK TO record_exercise")
+                conn.execute("RELEASE record_exercise")
+                if not self._pending_exercises:
+                    conn.execute("ROLLBACK")
             raise RuntimeError(f"Failed to record exercise: {e}") from e
 
         finally:
-            conn.close()
+            self._lock.release()
 
     def end_session(self, session_id: str) -> dict:
         """
@@ -564,16 +839,22 @@ class Coach:
         end_time = datetime.now(UTC)
         duration_actual = (end_time - session.start_time).total_seconds() / 60
 
-        # Log session end
-        self._log_session_end(
-            session_id,
-            session.learner_id,
-            session.exercises_completed,
-            duration_actual
-        )
+        # Get final strand balance, through the shared connection so
+        # exercises still pending in a batch are counted
+        with self._lock:
+            self._balance_cache = None
+            balance = self.planner.get_strand_balance(session.learner_id, conn=self._conn)
 
-        # Get final strand balance
-        balance = self.planner.get_strand_balance(session.learner_id)
+            # Log session end, then commit it together with any pending exercises
+            self._log_session_end(
+                session_id,
+                session.learner_id,
+                end_time,
+                session.exercises_completed,
+                duration_actual,
+                balance
+            )
+            self.flush()
 
         summary = {
             "session_id": session_id,
@@ -625,7 +906,8 @@ class Coach:
         if not profile:
             return promotions
 
-        # Check each skill
+        # Find the next level for each skill that can still be promoted
+        next_levels = {}
         for skill in ["reading", "listening", "speaking", "writing"]:
             current_secure = get_secure_level(learner_id, skill)
             current_secure_num = cefr_to_numeric(current_secure)
@@ -634,38 +916,27 @@ class Coach:
             if current_secure_num >= len(CEFR_LEVELS) - 1:
                 continue
 
-            # Get next level
-            next_level = CEFR_LEVELS[current_secure_num + 1]
+            next_levels[skill] = CEFR_LEVELS[current_secure_num + 1]
 
-            # Count mastered vs total at next level
-            conn = sqlite3.connect(self.mastery_db_path)
-            conn.execute(f"ATTACH DATABASE '{self.kg_db_path}' AS kg")
-            cursor = conn.cursor()
+        if not next_levels:
+            return promotions
 
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM items i
-                JOIN kg.nodes n ON i.node_id = n.node_id
-                WHERE i.skill = ? AND n.cefr_level = ?
-            """, (skill, next_level))
-            total = cursor.fetchone()[0]
+        # Count mastered vs total at next level, for all skills in one query
+        sql = COUNT_LEVEL_PROGRESS_SQL.format(targets=", ".join(["(?, ?)"] * len(next_levels)))
+        params = [value for target in next_levels.items() for value in target]
+        with self._lock:
+            self._attach_kg()
+            progress = {
+                skill: (total, mastered)
+                for skill, total, mastered in self._conn.execute(sql, params)
+            }
 
+        for skill, next_level in next_levels.items():
+            # Skills with no items at next level yet have no row
+            total, mastered = progress.get(skill, (0, 0))
             if total == 0:
-                # No items at next level yet
-                conn.close()
                 continue
 
-            cursor.execute("""
-                SELECT COUNT(*) as mastered
-                FROM items i
-                JOIN kg.nodes n ON i.node_id = n.node_id
-                WHERE i.skill = ?
-                  AND n.cefr_level = ?
-                  AND i.mastery_status IN ('mastered', 'fluency_ready')
-            """, (skill, next_level))
-            mastered = cursor.fetchone()[0]
-            conn.close()
-
             # Check if 80% mastered
             if mastered / total >= 0.80:
                 # Promote!
@@ -696,40 +967,33 @@ class Coach:
         This enables record_exercise() to work across separate process calls
         (e.g., when LLM makes multiple tool calls in separate Python invocations).
         """
-        conn = sqlite3.connect(self.mastery_db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        # Load from sessions table
-        cursor.execute("""
-            SELECT session_id, learner_id, start_time, duration_target_min, exercises_completed
-            FROM sessions
-            WHERE session_id = ?
-        """, (session_id,))
+            # Load from sessions table
+            cursor.execute(LOAD_SESSION_SQL, (session_id,))
 
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
-            return  # Session not found
+            row = cursor.fetchone()
+            if not row:
+                return  # Session not found
+            _, learner_id, start_time, duration_target_min, exercises_completed = row
 
-        # Query current strand balance
-        balance = self.planner.get_strand_balance(row['learner_id'])
+            # Query current strand balance
+            balance = self.planner.get_strand_balance(learner_id, conn=self._conn)
 
         # Get exercises_completed from sessions table
         # Note: total_quality is not stored for in-progress sessions, so we start at 0
         # It will be updated as exercises are recorded via record_exercise()
-        exercises_completed = row['exercises_completed'] or 0
+        exercises_completed = exercises_completed or 0
         total_quality = 0.0  # Will accumulate as exercises are recorded
 
-        conn.close()
-
         # Reconstruct SessionInfo
         # Note: exercises_remaining and exercises_planned are unknown, so we estimate
         session_info = SessionInfo(
-            session_id=row['session_id'],
-            learner_id=row['learner_id'],
-            start_time=datetime.fromisoformat(row['start_time']),
-            duration_target_minutes=row['duration_target_min'],
+            session_id=session_id,
+            learner_id=learner_id,
+            start_time=datetime.fromisoformat(start_time),
+            duration_target_minutes=duration_target_min,
             exercises_completed=exercises_completed,
             exercises_remaining=max(0, 10 - exercises_completed),  # Estimate: assume ~10 exercises
             exercises_planned=10,  # Estimate: typical session size
@@ -742,121 +1006,127 @@ class Coach:
 
         self.active_sessions[session_id] = session_info
 
-    def _log_session_start(self, session_id: str, learner_id: str, duration: int):
-        """Log session start to database."""
-        conn = sqlite3.connect(self.mastery_db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
-                learner_id TEXT NOT NULL,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP,
-                duration_target_min INTEGER,
-                duration_actual_min REAL,
-                exercises_completed INTEGER DEFAULT 0
-            )
-        """)
-
-        cursor.execute("""
-            INSERT INTO sessions (session_id, learner_id, start_time, duration_target_min)
-            VALUES (?, ?, ?, ?)
-        """, (session_id, learner_id, datetime.now(UTC).isoformat(), duration))
+    def _advance_strand_balance(
+        self,
+        strand: str,
+        session_date: str,
+        duration_seconds: float
+    ) -> StrandBalance:
+        """
+        Return the strand balance including an exercise that was just written.
 
-        conn.commit()
-        conn.close()
+        The view is aggregated once, and again whenever the UTC day changes
+        (its window is relative to the current date); in between, each call
+        adds the exercise's seconds to the cached totals.
+        """
+        cached = self._balance_cache
+        if cached is None or cached[0] != session_date:
+            strand_seconds = dict.fromkeys(STRAND_NAMES, 0)
+            groups: set[tuple[str, str]] = set()
+            for day, row_strand, seconds in self.planner.get_strand_seconds(conn=self._conn):
+                groups.add((day, row_strand))
+                if row_strand in strand_seconds:
+                    strand_seconds[row_strand] += seconds
+            self._balance_cache = (session_date, strand_seconds, groups)
+        else:
+            _, strand_seconds, groups = cached
+            groups.add((session_date, strand))
+            if strand in strand_seconds:
+                if strand == "fluency":
+                    extra = duration_seconds if duration_seconds is not None else 60
+                else:
+                    extra = STRAND_LOG_SECONDS.get(strand, 0)
+                strand_seconds[strand] += REVIEW_HISTORY_SECONDS + extra
+
+        return StrandBalance.from_seconds(strand_seconds, len(groups))
+
+    def _preload_items(self, approved_plan: list[dict]) -> dict[str, tuple]:
+        """Fetch the FETCH_ITEM_SQL row of every planned item in one query."""
+        item_ids = list(dict.fromkeys(ex["item_id"] for ex in approved_plan if ex["item_id"]))
+        if not item_ids:
+            return {}
+
+        sql = self._preload_items_sql.format(item_ids=", ".join(["(?)"] * len(item_ids)))
+        with self._lock:
+            cursor = self._conn.cursor()
+            return {row[0]: row[1:] for row in cursor.execute(sql, item_ids)}
+
+    def _log_session_start(self, session_id: str, learner_id: str, start_time: datetime, duration: int):
+        """Log session start to database."""
+        with self._transaction() as cursor:
+            cursor.execute(INSERT_SESSION_SQL, (session_id, learner_id, start_time.isoformat(), duration))
 
-    def _log_session_end(self, session_id: str, learner_id: str, exercises: int, duration: float):
+    def _log_session_end(
+        self,
+        session_id: str,
+        learner_id: str,
+        end_time: datetime,
+        exercises: int,
+        duration: float,
+        balance: StrandBalance
+    ):
         """Log session end to database (both sessions and session_log tables)."""
         if session_id not in self.active_sessions:
             # Session already removed, can't get full metrics
             return
 
         session = self.active_sessions[session_id]
-        balance = self.planner.get_strand_balance(learner_id)
         balance_status = self._assess_balance_status(balance)
 
         # Calculate quality average
         quality_avg = session.total_quality / session.exercises_completed if session.exercises_completed > 0 else 0.0
 
-        conn = sqlite3.connect(self.mastery_db_path)
-        cursor = conn.cursor()
-
-        # Update sessions table (backward compatibility)
-        cursor.execute("""
-            UPDATE sessions
-            SET end_time = ?, exercises_completed = ?, duration_actual_min = ?
-            WHERE session_id = ?
-        """, (datetime.now(UTC).isoformat(), exercises, duration, session_id))
-
-        # Insert into session_log table (new structured logging with audit trail)
-        negotiated_weights_json = json.dumps(session.negotiated_weights) if session.negotiated_weights else None
-        approved_plan_json = json.dumps(session.approved_plan) if session.approved_plan else None
-
-        cursor.execute("""
-            INSERT INTO session_log (
-                session_id, learner_id, started_at, ended_at,
-                duration_target_min, duration_actual_min,
-                exercises_planned, exercises_completed,
-                strand_mi_pct, strand_mo_pct, strand_lf_pct, strand_fl_pct,
-                balance_status, quality_avg, mastery_changes,
-                negotiated_weights, approved_plan, notes
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            session_id,
-            learner_id,
-            session.start_time.isoformat(),
-            datetime.now(UTC).isoformat(),
-            session.duration_target_minutes,
-            duration,
-            session.exercises_planned,
-            exercises,
-            balance.meaning_input * 100,
-            balance.meaning_output * 100,
-            balance.language_focused * 100,
-            balance.fluency * 100,
-            balance_status,
-            quality_avg,
-            session.mastery_changes,
-            negotiated_weights_json,
-            approved_plan_json,
-            session.session_notes
-        ))
-
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+
+            # Update sessions table (backward compatibility)
+            end_time_iso = end_time.isoformat()
+            cursor.execute(END_SESSION_SQL, (end_time_iso, exercises, duration, session_id))
+
+            # Insert into session_log table (new structured logging with audit trail)
+            cursor.execute(INSERT_SESSION_LOG_SQL, (
+                session_id,
+                learner_id,
+                session.start_time.isoformat(),
+                end_time_iso,
+                session.duration_target_minutes,
+                duration,
+                session.exercises_planned,
+                exercises,
+                balance.meaning_input * 100,
+                balance.meaning_output * 100,
+                balance.language_focused * 100,
+                balance.fluency * 100,
+                balance_status,
+                quality_avg,
+                session.mastery_changes,
+                session.negotiated_weights_json,
+                session.approved_plan_json,
+                session.session_notes
+            ))
 
     def _log_to_strand_table(
         self,
         cursor,
         strand: str,
         item_id: str,
+        node_id: str,
         session_id: str,
+        session_date: str,
         quality: int,
         duration_seconds: float,
         response_text: str
     ):
         """Log exercise to appropriate strand table."""
-        session_date = datetime.now(UTC).date().isoformat()
-        node_id = ".".join(item_id.split(".")[:-1]) if "." in item_id else item_id
 
         if strand == "meaning_input":
             # Schema: node_id, item_id, session_date, comprehension_quality,
             # understood_key_points, required_repetitions, task_type, notes
-            cursor.execute("""
-                INSERT INTO meaning_input_log (
-                    node_id, item_id, session_date, comprehension_quality,
-                    understood_key_points, required_repetitions, task_type, notes
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(INSERT_MEANING_INPUT_SQL, (
                 node_id,
                 item_id,
                 session_date,
                 quality,
-                True if quality >= 3 else False,  # Success if quality >= 3
+                quality >= 3,  # Success if quality >= 3
                 1,  # Could track this later
                 "comprehension",
                 response_text[:200]
@@ -865,17 +1135,11 @@ class Coach:
         elif strand == "meaning_output":
             # Schema: node_id, item_id, session_date, communication_successful,
             # quality, errors_noted, required_clarification, task_type, notes
-            cursor.execute("""
-                INSERT INTO meaning_output_log (
-                    node_id, item_id, session_date, communication_successful,
-                    quality, errors_noted, required_clarification, task_type, notes
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(INSERT_MEANING_OUTPUT_SQL, (
                 node_id,
                 item_id,
                 session_date,
-                True if quality >= 3 else False,
+                quality >= 3,
                 quality,
                 "",  # Could extract errors later
                 False,  # Could track this later
@@ -890,14 +1154,7 @@ class Coach:
             words = len(response_text.split())
             wpm = (words / duration_seconds) * 60 if duration_seconds > 0 else 0
 
-            cursor.execute("""
-                INSERT INTO fluency_metrics (
-                    item_id, session_date, duration_seconds, output_word_count,
-                    words_per_minute, pause_count, hesitation_markers,
-                    baseline_wpm, improvement_pct, smoothness, improvement_feel, notes
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(INSERT_FLUENCY_SQL, (
                 item_id,
                 session_date,
                 duration_seconds,
@@ -914,50 +1171,155 @@ class Coach:
 
         # language_focused doesn't have a separate log table (uses review_history)
 
-    def _check_mastery_status(self, cursor, item_id: str) -> tuple[str, str]:
-        """Check and update mastery status."""
-        # Get item data
-        cursor.execute("""
-            SELECT
-                i.item_id,
-                i.stability,
-                i.reps,
-                i.mastery_status,
-                AVG(rh.quality) as avg_quality
-            FROM items i
-            LEFT JOIN review_history rh ON i.item_id = rh.item_id
-            WHERE i.item_id = ?
-            GROUP BY i.item_id
-        """, (item_id,))
-
-        item = cursor.fetchone()
-        if not item:
-            return ("not_found", "not_found")
-
-        old_status = item["mastery_status"] or "new"
-        stability = item["stability"] or 0
-        reps = item["reps"] or 0
-        avg_quality = item["avg_quality"] or 0
-
-        # Check mastery criteria
-        if (stability >= self.mastery_criteria["stability_days"] and
-            reps >= self.mastery_criteria["min_reps"] and
-            avg_quality >= self.mastery_criteria["avg_quality"]):
-            new_status = "mastered"
-        elif reps == 0:
-            new_status = "new"
+    def _fetch_item(self, cursor: sqlite3.Cursor, session: SessionInfo, item_id: str) -> tuple:
+        """
+        Return the FETCH_ITEM_SQL row for an item about to be reviewed.
+
+        Planned items were preloaded by start_session; the review makes the
+        row stale, so it is dropped from every session's cache.
+        """
+        row = session.item_cache.get(item_id)
+        for active in self.active_sessions.values():
+            active.item_cache.pop(item_id, None)
+        if row is None:
+            cursor.execute(self._fetch_item_sql, (item_id,))
+            row = cursor.fetchone() or NEW_ITEM_ROW
+        return row
+
+    def _review_item(
+        self,
+        row: tuple,
+        quality: int,
+        review_time: datetime,
+        review_time_ms: int
+    ) -> tuple[ReviewCard, float, float]:
+        """
+        Run the FSRS kernel for a review of a FETCH_ITEM_SQL row.
+
+        Returns:
+            (updated card, stability before the review, difficulty before the review)
+        """
+        found_item_id, stability, difficulty, reps, last_review, last_review_ms = row[:6]
+
+        if found_item_id is not None:
+            # Existing item - prefer the epoch-ms column and parse the
+            # ISO string only for rows written without it
+            if last_review_ms is not None:
+                elapsed_days = (review_time_ms - last_review_ms) / MS_PER_DAY
+            elif last_review:
+                elapsed_days = (review_time - datetime.fromisoformat(last_review)).total_seconds() / 86400
+            else:
+                elapsed_days = 0.0
+            old_stability = stability or 0.0
+            old_difficulty = difficulty or 5.0
+            old_reps = reps or 0
         else:
-            new_status = "learning"
+            # New item - initialize
+            elapsed_days = 0.0
+            old_stability, old_difficulty, old_reps = 0.0, 5.0, 0
 
-        # Update if changed
-        if old_status != new_status:
-            cursor.execute("""
-                UPDATE items
-                SET mastery_status = ?, last_mastery_check = ?
-                WHERE item_id = ?
-            """, (new_status, datetime.now(UTC).isoformat(), item_id))
+        new_stability, new_difficulty, _ = review_card_kernel(
+            old_stability, old_difficulty, old_reps, elapsed_days, quality, DEFAULT_W
+        )
+        updated_card = ReviewCard(
+            stability=new_stability,
+            difficulty=new_difficulty,
+            reps=old_reps + 1,
+            last_review=review_time
+        )
+        return updated_card, old_stability, old_difficulty
+
+    def _update_mastery_status(
+        self,
+        row: tuple,
+        updated_card: ReviewCard,
+        quality: int
+    ) -> tuple[str, bool]:
+        """
+        Assess a FETCH_ITEM_SQL row's mastery status after a review.
 
-        return (old_status, new_status)
+        The row's running quality totals are extended by the review being
+        recorded, so no review_history read is needed.
+
+        Returns:
+            (new mastery status, whether it differs from the stored status)
+        """
+        mastery_status, quality_sum, review_count = row[6:]
+        avg_quality = ((quality_sum or 0) + quality) / (review_count + 1)
+        new_status = self._assess_mastery(updated_card.stability, updated_card.reps, avg_quality)
+        return new_status, (mastery_status or "new") != new_status
+
+    def _upsert_item(
+        self,
+        cursor: sqlite3.Cursor,
+        item_id: str,
+        exercise_type: str,
+        strand: str,
+        quality: int,
+        updated_card: ReviewCard,
+        mastery_status: str,
+        review_time_iso: str,
+        review_time_ms: int
+    ) -> str:
+        """Write a reviewed item's FSRS state and mastery status; returns its node_id."""
+        # Extract node_id from item_id (e.g., "card.es.ser_vs_estar.001" → "card.es.ser_vs_estar")
+        node_id, dot, _ = item_id.rpartition(".")
+        if not dot:
+            node_id = item_id
+
+        cursor.execute(self._upsert_item_sql, {
+            "item_id": item_id,
+            "node_id": node_id,
+            "type": exercise_type,
+            "last_review": review_time_iso,
+            "last_review_ms": review_time_ms,
+            "stability": updated_card.stability,
+            "difficulty": updated_card.difficulty,
+            "reps": updated_card.reps,
+            "primary_strand": strand,
+            "mastery_status": mastery_status,
+            "last_mastery_check": review_time_iso,
+            "quality_sum": quality,
+            "review_count": 1,
+        })
+        return node_id
+
+    def _assess_mastery(self, stability: float, reps: int, avg_quality: float) -> str:
+        """Classify an item's mastery status from its FSRS state and review quality."""
+        if (stability >= self._mastery_stability_days and
+            reps >= self._mastery_min_reps and
+            avg_quality >= self._mastery_avg_quality):
+            return "mastered"
+        if reps == 0:
+            return "new"
+        return "learning"
+
+    def _plan_response(self, plan: SessionPlan) -> dict:
+        """Project a session plan into the response shared by preview_session() and start_session()."""
+        balance = plan.strand_balance
+        return {
+            "exercises": [
+                {
+                    "strand": ex.strand,
+                    "node_id": ex.node_id,
+                    "item_id": ex.item_id,
+                    "exercise_type": ex.exercise_type,
+                    "duration_estimate_min": ex.duration_estimate_min,
+                    "instructions": ex.instructions
+                }
+                for ex in plan.exercises
+            ],
+            "total_exercises": len(plan.exercises),
+            "balance_status": plan.balance_status,
+            "current_balance": {
+                "meaning_input": f"{balance.meaning_input * 100:.1f}%",
+                "meaning_output": f"{balance.meaning_output * 100:.1f}%",
+                "language_focused": f"{balance.language_focused * 100:.1f}%",
+                "fluency": f"{balance.fluency * 100:.1f}%"
+            },
+            "notes": plan.notes,
+            "llm_guidance": self._generate_session_guidance(plan)
+        }
 
     def _generate_session_guidance(self, plan) -> str:
         """Generate guidance for LLM at session start."""
@@ -976,44 +1338,32 @@ class Coach:
         balance: StrandBalance
     ) -> str:
         """Generate feedback for LLM after exercise."""
-        feedback_parts = []
-
         # Quality acknowledgment
         if quality >= 4:
-            feedback_parts.append("Strong performance!")
+            acknowledgment = "Strong performance!"
         elif quality >= 3:
-            feedback_parts.append("Good effort.")
+            acknowledgment = "Good effort."
         else:
-            feedback_parts.append("Keep practicing.")
-
-        # FSRS info
-        feedback_parts.append(f"Stability: {card.stability:.1f} days")
+            acknowledgment = "Keep practicing."
 
         # Mastery progression
-        if mastery_changed:
-            feedback_parts.append(f"Status changed to: {mastery_status}")
-        else:
-            feedback_parts.append(f"Status: {mastery_status}")
+        status_prefix = "Status changed to" if mastery_changed else "Status"
+
+        # Acknowledgment, FSRS info and mastery status
+        feedback = (
+            f"{acknowledgment} | Stability: {card.stability:.1f} days"
+            f" | {status_prefix}: {mastery_status}"
+        )
 
         # Balance reminder if needed
-        deviations = [
-            abs(balance.meaning_input - 0.25),
-            abs(balance.meaning_output - 0.25),
-            abs(balance.language_focused - 0.25),
-            abs(balance.fluency - 0.25)
-        ]
-        if max(deviations) > 0.10:
-            feedback_parts.append("⚠ Strand balance needs attention")
+        if balance.max_deviation > 0.10:
+            feedback += " | ⚠ Strand balance needs attention"
 
-        return " | ".join(feedback_parts)
+        return feedback
 
     def _assess_balance_status(self, balance: StrandBalance) -> str:
         """Assess balance status."""
-        strands = ["meaning_input", "meaning_output", "language_focused", "fluency"]
-        max_deviation = max(
-            abs(balance.deviation_from_target(s))
-            for s in strands
-        )
+        max_deviation = balance.max_deviation
 
         if max_deviation <= 0.05:
             return "balanced"
@@ -312,6 +312,51 @@ def calculate_next_review_date(
     return current_time + timedelta(days=interval_days)
 
 
+def review_card_kernel(
+    stability: float,
+    difficulty: float,
+    reps: int,
+    elapsed_days: float,
+    quality: int,
+    w: list[float] = DEFAULT_W
+) -> Tuple[float, float, float]:
+    """
+    Apply one review to a card's FSRS parameters, on plain numbers.
+
+    This is the arithmetic core of review_card(), without datetime handling or
+    dataclass construction, for callers that already hold the raw values
+    (e.g. a database row with an epoch-millisecond last review).
+
+    Args:
+        stability: Current stability in days
+        difficulty: Current difficulty (0-10 scale)
+        reps: Number of reviews so far (0 for a new card)
+        elapsed_days: Days since the last review (ignored for new cards)
+        quality: Review quality (0-5 scale)
+        w: FSRS weight parameters
+
+    Returns:
+        Tuple of (new_stability, new_difficulty, retrievability)
+
+    Raises:
+        ValueError: If quality is not in range 0-5
+    """
+    if not 0 <= quality <= 5:
+        raise ValueError(f"Quality must be in range 0-5, got {quality}")
+
+    # Handle new cards (first review)
+    if reps == 0:
+        return initial_stability(quality, w), initial_difficulty(quality, w), 1.0  # No decay yet
+
+    # Calculate retrievability at review time
+    retrievability = calculate_retrievability(elapsed_days, stability, w)
+
+    # Update parameters based on review
+    new_stability = update_stability(stability, difficulty, quality, retrievability, w)
+    new_difficulty = update_difficulty(difficulty, quality, w)
+    return new_stability, new_difficulty, retrievability
+
+
 def review_card(
     card: ReviewCard,
     quality: int,
@@ -344,32 +389,18 @@ def review_card(
         >>> updated_card, result = review_card(card, quality=4)
         >>> print(f"Next review in {(result.next_review_date - datetime.now()).days} days")
     """
-    if not 0 <= quality <= 5:
-        raise ValueError(f"Quality must be in range 0-5, got {quality}")
-
     if review_time is None:
         review_time = datetime.now()
 
-    # Handle new cards (first review)
-    if card.reps == 0:
-        new_stability = initial_stability(quality, w)
-        new_difficulty = initial_difficulty(quality, w)
-        retrievability = 1.0  # No decay yet
+    # Calculate elapsed time since last review
+    if card.reps == 0 or card.last_review is None:
+        elapsed_days = 0.0
     else:
-        # Calculate elapsed time since last review
-        if card.last_review is None:
-            elapsed_days = 0.0
-        else:
-            elapsed_days = (review_time - card.last_review).total_seconds() / 86400
-
-        # Calculate retrievability at review time
-        retrievability = calculate_retrievability(elapsed_days, card.stability, w)
-
-        # Update parameters based on review
-        new_stability = update_stability(
-            card.stability, card.difficulty, quality, retrievability, w
-        )
-        new_difficulty = update_difficulty(card.difficulty, quality, w)
+        elapsed_days = (review_time - card.last_review).total_seconds() / 86400
+
+    new_stability, new_difficulty, retrievability = review_card_kernel(
+        card.stability, card.difficulty, card.reps, elapsed_days, quality, w
+    )
 
     # Calculate next review date
     next_review = calculate_next_review_date(new_stability, review_time)
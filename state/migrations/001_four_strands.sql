@@ -131,6 +131,8 @@ WHERE
     AND (i.reps < 3 OR i.stability < 21.0 OR i.stability IS NULL);
 
 -- View: Recent strand balance (last 10 sessions)
+-- Coach._advance_strand_balance mirrors these per-row seconds (REVIEW_HISTORY_SECONDS,
+-- STRAND_LOG_SECONDS and the fluency default in state/coach.py): update them together
 CREATE VIEW IF NOT EXISTS strand_balance_recent AS
 SELECT
     DATE(session_date) as session_day,
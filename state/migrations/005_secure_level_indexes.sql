@@ -0,0 +1,24 @@
+-- Migration 005: Covering Indexes for Secure-Level Counts
+-- Date: 2026-10-16
+-- Description: Index items by (skill, node_id, mastery_status) so update_secure_levels() counts from the index
+-- Reference: state/coach.py update_secure_levels()
+
+-- ============================================================================
+-- PHASE 1: Covering index for per-skill mastery counts
+-- ============================================================================
+
+-- update_secure_levels() counts items per skill joined to kg.nodes on node_id,
+-- optionally restricted to mastered items. With all three columns in one index
+-- both counts are answered without touching the items table.
+CREATE INDEX IF NOT EXISTS idx_items_skill_node_mastery ON items(skill, node_id, mastery_status);
+
+-- ============================================================================
+-- PHASE 2: Refresh planner statistics
+-- ============================================================================
+
+-- Lets the query planner choose between the new index and idx_items_skill_mastery
+ANALYZE;
+
+-- Track migration
+INSERT INTO schema_migrations (migration_id, description)
+VALUES ('005_secure_level_indexes', 'Covering index for secure-level mastery counts');
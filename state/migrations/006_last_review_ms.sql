@@ -0,0 +1,26 @@
+-- Migration 006: Epoch-Millisecond Review Timestamps
+-- Date: 2026-10-16
+-- Description: Store items.last_review as INTEGER epoch milliseconds alongside the ISO-8601 text
+-- Reference: state/coach.py record_exercise()
+
+-- ============================================================================
+-- PHASE 1: Add last_review_ms column
+-- ============================================================================
+
+-- record_exercise() writes both last_review and last_review_ms, and reads the
+-- integer back so it no longer parses an ISO-8601 string per exercise.
+-- last_review stays the source for views and julianday() queries.
+ALTER TABLE items ADD COLUMN last_review_ms INTEGER;
+
+-- ============================================================================
+-- PHASE 2: Backfill from existing ISO-8601 timestamps
+-- ============================================================================
+
+-- 2440587.5 is the Julian day of the Unix epoch (1970-01-01T00:00:00Z)
+UPDATE items
+SET last_review_ms = CAST(ROUND((julianday(last_review) - 2440587.5) * 86400000) AS INTEGER)
+WHERE last_review IS NOT NULL;
+
+-- Track migration
+INSERT INTO schema_migrations (migration_id, description)
+VALUES ('006_last_review_ms', 'Epoch-millisecond last_review column for items');
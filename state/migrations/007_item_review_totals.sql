@@ -0,0 +1,31 @@
+-- Migration 007: Denormalized Review Totals
+-- Date: 2026-10-16
+-- Description: Keep each item's review_history quality sum and count on items
+-- Reference: state/coach.py record_exercise()
+
+-- ============================================================================
+-- PHASE 1: Add review total columns
+-- ============================================================================
+
+-- record_exercise() assesses mastery on the item's average review quality.
+-- It now reads quality_sum / review_count from the items row it already
+-- fetches and adds each new review to them in its upsert, instead of
+-- aggregating review_history on every exercise. Integer totals rather than a
+-- stored average, so repeated updates accumulate no rounding error.
+ALTER TABLE items ADD COLUMN quality_sum INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE items ADD COLUMN review_count INTEGER NOT NULL DEFAULT 0;
+
+-- ============================================================================
+-- PHASE 2: Backfill from review_history
+-- ============================================================================
+
+UPDATE items
+SET (quality_sum, review_count) = (
+    SELECT COALESCE(SUM(rh.quality), 0), COUNT(*)
+    FROM review_history rh
+    WHERE rh.item_id = items.item_id
+);
+
+-- Track migration
+INSERT INTO schema_migrations (migration_id, description)
+VALUES ('007_item_review_totals', 'Review quality sum and count columns for items');
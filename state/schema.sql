@@ -13,6 +13,7 @@ CREATE TABLE IF NOT EXISTS items (
     node_id TEXT NOT NULL,                 -- Reference to knowledge graph node
     type TEXT NOT NULL,                    -- Type: 'vocabulary', 'grammar', 'phrase', etc.
     last_review TIMESTAMP,                 -- Last time the item was reviewed (NULL if never reviewed)
+    last_review_ms INTEGER,                -- last_review as Unix epoch milliseconds (added in migration 006)
     stability REAL DEFAULT 0.0,            -- FSRS stability parameter (in days)
     difficulty REAL DEFAULT 5.0,           -- FSRS difficulty parameter (0-10 scale)
     reps INTEGER DEFAULT 0,                -- Number of times reviewed
@@ -23,6 +24,8 @@ CREATE TABLE IF NOT EXISTS items (
     skill TEXT,                            -- Primary skill: 'reading', 'listening', 'speaking', 'writing' (added in migration 003)
     mastery_status TEXT DEFAULT 'learning', -- Status: 'new', 'learning', 'mastered', 'fluency_ready'
     last_mastery_check TIMESTAMP,          -- Last time mastery status was evaluated
+    quality_sum INTEGER NOT NULL DEFAULT 0,  -- Sum of review_history.quality for this item (added in migration 007)
+    review_count INTEGER NOT NULL DEFAULT 0, -- Number of review_history rows for this item (added in migration 007)
 
     FOREIGN KEY (node_id) REFERENCES knowledge_graph(node_id) ON DELETE CASCADE
 );
@@ -132,6 +135,7 @@ CREATE INDEX IF NOT EXISTS idx_items_mastery_status ON items(mastery_status);
 CREATE INDEX IF NOT EXISTS idx_items_strand ON items(primary_strand);
 CREATE INDEX IF NOT EXISTS idx_items_skill ON items(skill);  -- Added in migration 003
 CREATE INDEX IF NOT EXISTS idx_items_skill_mastery ON items(skill, mastery_status, stability);  -- For fluency queries
+CREATE INDEX IF NOT EXISTS idx_items_skill_node_mastery ON items(skill, node_id, mastery_status);  -- Secure-level counts (migration 005)
 
 -- Review history indexes
 CREATE INDEX IF NOT EXISTS idx_review_history_item_id ON review_history(item_id);
@@ -214,6 +218,8 @@ WHERE
     AND (i.reps < 3 OR i.stability < 21.0 OR i.stability IS NULL);
 
 -- View: Recent strand balance (last 10 sessions)
+-- Coach._advance_strand_balance mirrors these per-row seconds (REVIEW_HISTORY_SECONDS,
+-- STRAND_LOG_SECONDS and the fluency default in state/coach.py): update them together
 CREATE VIEW IF NOT EXISTS strand_balance_recent AS
 SELECT
     DATE(session_date) as session_day,
@@ -14,6 +14,7 @@ import json
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 import yaml
@@ -93,7 +94,7 @@ def get_secure_level(learner_id: str, skill: str) -> str:
     return skill_prof.get("secure_level", "A1")
 
 
-@dataclass
+@dataclass(frozen=True)
 class StrandBalance:
     """Current strand balance over recent sessions."""
     meaning_input: float      # Percentage (0.0-1.0)
@@ -103,6 +104,39 @@ class StrandBalance:
     total_exercises: int
     total_seconds: float
 
+    @classmethod
+    def from_seconds(cls, strand_seconds: dict[str, float], total_exercises: int) -> "StrandBalance":
+        """
+        Build a balance from seconds practiced per strand.
+
+        Args:
+            strand_seconds: Seconds per strand (keys: the four strand names)
+            total_exercises: Number of (day, strand) groups the seconds came from
+
+        Returns:
+            StrandBalance with percentage distribution (equal split if no practice)
+        """
+        total_seconds = sum(strand_seconds.values())
+        if total_seconds == 0:
+            # No recent practice, return equal distribution
+            return cls(
+                meaning_input=0.25,
+                meaning_output=0.25,
+                language_focused=0.25,
+                fluency=0.25,
+                total_exercises=0,
+                total_seconds=0
+            )
+
+        return cls(
+            meaning_input=strand_seconds["meaning_input"] / total_seconds,
+            meaning_output=strand_seconds["meaning_output"] / total_seconds,
+            language_focused=strand_seconds["language_focused"] / total_seconds,
+            fluency=strand_seconds["fluency"] / total_seconds,
+            total_exercises=total_exercises,
+            total_seconds=total_seconds
+        )
+
     def get_percentage(self, strand: str) -> float:
         """Get percentage for a specific strand."""
         return getattr(self, strand)
@@ -111,6 +145,16 @@ class StrandBalance:
         """Calculate deviation from 25% target."""
         return TARGET_STRAND_PERCENTAGE - self.get_percentage(strand)
 
+    @cached_property
+    def max_deviation(self) -> float:
+        """Largest absolute deviation of any strand from the 25% target."""
+        return max(
+            abs(TARGET_STRAND_PERCENTAGE - self.meaning_input),
+            abs(TARGET_STRAND_PERCENTAGE - self.meaning_output),
+            abs(TARGET_STRAND_PERCENTAGE - self.language_focused),
+            abs(TARGET_STRAND_PERCENTAGE - self.fluency),
+        )
+
 
 @dataclass
 class Exercise:
@@ -158,23 +202,31 @@ class SessionPlanner:
         self.mastery_db_path = mastery_db_path
         self.mastery_criteria = mastery_criteria or DEFAULT_MASTERY_CRITERIA
 
-    def get_strand_balance(self, learner_id: str, last_n_sessions: int = 10) -> StrandBalance:
+    def get_strand_seconds(
+        self,
+        last_n_sessions: int = 10,
+        conn: sqlite3.Connection | None = None
+    ) -> list[tuple[str, str, float]]:
         """
-        Get strand balance over recent sessions.
+        Get seconds practiced per (day, strand) over recent sessions.
 
         Args:
-            learner_id: Learner identifier
             last_n_sessions: Number of recent sessions to analyze
+            conn: Existing mastery connection to read through (optional;
+                sees that connection's uncommitted writes)
 
         Returns:
-            StrandBalance with percentage distribution
+            List of (session_day, strand, total_seconds) rows
         """
-        conn = sqlite3.connect(self.mastery_db_path)
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(self.mastery_db_path)
         cursor = conn.cursor()
 
         # Query strand_balance_summary view
         cursor.execute("""
             SELECT
+                session_day,
                 strand,
                 total_seconds
             FROM strand_balance_recent
@@ -182,7 +234,29 @@ class SessionPlanner:
         """, (last_n_sessions,))
 
         results = cursor.fetchall()
-        conn.close()
+        if own_conn:
+            conn.close()
+        return results
+
+    def get_strand_balance(
+        self,
+        learner_id: str,
+        last_n_sessions: int = 10,
+        conn: sqlite3.Connection | None = None
+    ) -> StrandBalance:
+        """
+        Get strand balance over recent sessions.
+
+        Args:
+            learner_id: Learner identifier
+            last_n_sessions: Number of recent sessions to analyze
+            conn: Existing mastery connection to read through (optional;
+                see get_strand_seconds)
+
+        Returns:
+            StrandBalance with percentage distribution
+        """
+        results = self.get_strand_seconds(last_n_sessions, conn)
 
         # Calculate totals
         strand_seconds = {
@@ -192,32 +266,11 @@ class SessionPlanner:
             "fluency": 0
         }
 
-        total_seconds = 0
-        for strand, seconds in results:
+        for _, strand, seconds in results:
             if strand in strand_seconds:
                 strand_seconds[strand] += seconds
-                total_seconds += seconds
-
-        # Calculate percentages
-        if total_seconds == 0:
-            # No recent practice, return equal distribution
-            return StrandBalance(
-                meaning_input=0.25,
-                meaning_output=0.25,
-                language_focused=0.25,
-                fluency=0.25,
-                total_exercises=0,
-                total_seconds=0
-            )
 
-        return StrandBalance(
-            meaning_input=strand_seconds["meaning_input"] / total_seconds,
-            meaning_output=strand_seconds["meaning_output"] / total_seconds,
-            language_focused=strand_seconds["language_focused"] / total_seconds,
-            fluency=strand_seconds["fluency"] / total_seconds,
-            total_exercises=len(results),
-            total_seconds=total_seconds
-        )
+        return StrandBalance.from_seconds(strand_seconds, len(results))
 
     def calculate_strand_weights(
         self,
@@ -386,20 +439,28 @@ class SessionPlanner:
         finally:
             kg_conn.close()
 
-    def get_due_items(self, learner_id: str, limit: int = 30) -> list[dict]:
+    def get_due_items(
+        self,
+        learner_id: str,
+        limit: int = 30,
+        conn: sqlite3.Connection | None = None
+    ) -> list[dict]:
         """
         Get items due for review from SRS.
 
         Args:
             learner_id: Learner identifier
             limit: Maximum items to return
+            conn: Existing mastery connection to read through (optional)
 
         Returns:
             List of due items with FSRS metadata
         """
-        conn = sqlite3.connect(self.mastery_db_path)
-        conn.row_factory = sqlite3.Row
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(self.mastery_db_path)
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         # Query items table directly (due_items view doesn't include new columns)
         cursor.execute("""
@@ -423,11 +484,17 @@ class SessionPlanner:
         """, (limit,))
 
         items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        if own_conn:
+            conn.close()
 
         return items
 
-    def get_mastered_items(self, learner_id: str, limit: int = 20) -> list[dict]:
+    def get_mastered_items(
+        self,
+        learner_id: str,
+        limit: int = 20,
+        conn: sqlite3.Connection | None = None
+    ) -> list[dict]:
         """
         Get mastered items ready for fluency practice.
 
@@ -436,13 +503,16 @@ class SessionPlanner:
         Args:
             learner_id: Learner identifier
             limit: Maximum items to return
+            conn: Existing mastery connection to read through (optional)
 
         Returns:
             List of mastered items
         """
-        conn = sqlite3.connect(self.mastery_db_path)
-        conn.row_factory = sqlite3.Row
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(self.mastery_db_path)
         cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
         cursor.execute("""
             SELECT
@@ -458,7 +528,8 @@ class SessionPlanner:
         """, (limit,))
 
         items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        if own_conn:
+            conn.close()
 
         return items
 
@@ -538,7 +609,8 @@ class SessionPlanner:
         self,
         learner_id: str,
         duration_minutes: int = 20,
-        learner_preference: dict[str, float] | None = None
+        learner_preference: dict[str, float] | None = None,
+        conn: sqlite3.Connection | None = None
     ) -> SessionPlan:
         """
         Plan a balanced session across four strands.
@@ -547,20 +619,28 @@ class SessionPlanner:
             learner_id: Learner identifier
             duration_minutes: Target session duration
             learner_preference: Optional strand preference override
+            conn: Existing mastery connection for the mastery reads (optional;
+                otherwise one connection is opened for all of them)
 
         Returns:
             SessionPlan with exercises across all strands
         """
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(self.mastery_db_path)
+
         # 1. Get current strand balance
-        balance = self.get_strand_balance(learner_id)
+        balance = self.get_strand_balance(learner_id, conn=conn)
 
         # 2. Calculate weights (pressure to rebalance)
         weights = self.calculate_strand_weights(balance, learner_preference)
 
         # 3. Get available materials
         frontier = self.get_frontier_nodes(learner_id, limit=20)
-        due_items = self.get_due_items(learner_id, limit=30)
-        mastered = self.get_mastered_items(learner_id, limit=20)
+        due_items = self.get_due_items(learner_id, limit=30, conn=conn)
+        mastered = self.get_mastered_items(learner_id, limit=20, conn=conn)
+        if own_conn:
+            conn.close()
 
         # 4. Strand scarcity pressure: Filter to strands with viable candidates
         # Pre-check which strands have materials available
@@ -845,12 +925,7 @@ class SessionPlanner:
 
     def _assess_balance_status(self, balance: StrandBalance) -> str:
         """Assess whether balance is acceptable."""
-        strands = ["meaning_input", "meaning_output", "language_focused", "fluency"]
-
-        max_deviation = max(
-            abs(balance.deviation_from_target(s))
-            for s in strands
-        )
+        max_deviation = balance.max_deviation
 
         if max_deviation <= TOLERANCE_PERCENTAGE:
             return "balanced"
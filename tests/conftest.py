@@ -93,6 +93,9 @@ def tmp_kg_db(tmp_path: Path) -> Path:
     # Indexes
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_cefr ON nodes(cefr_level)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_nodes_cefr_node ON nodes(cefr_level, node_id)"
+    )
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id)"
     )
@@ -549,6 +552,18 @@ def populated_mastery_db(
                     ),
                 )
 
+    # Keep the items review totals (migration 007) in step with the history above
+    cursor.execute(
+        """
+        UPDATE items
+        SET (quality_sum, review_count) = (
+            SELECT COALESCE(SUM(quality), 0), COUNT(*)
+            FROM review_history rh
+            WHERE rh.item_id = items.item_id
+        )
+        """
+    )
+
     conn.commit()
     conn.close()
 
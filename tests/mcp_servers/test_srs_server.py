@@ -762,3 +762,194 @@ def test_complete_srs_workflow(
     conn.close()
 
     assert new_stability > original_stability
+
+
+@pytest.mark.mcp
+@pytest.mark.srs
+@pytest.mark.integration
+def test_srs_batch_update_matches_sequential_updates(tmp_path: Path) -> None:
+    """
+    Test srs.batch_update writes the same state as sequential srs.update calls,
+    including repeated item_ids within one batch.
+    """
+    from mcp_servers.srs_server.server import SRSServer
+
+    reviews = [("item.es.ser.001", 4), ("item.es.estar.002", 1), ("item.es.ser.001", 2)]
+
+    sequential = SRSServer(db_path=tmp_path / "sequential.sqlite")
+    for item_id, quality in reviews:
+        assert json.loads(sequential.update_item(item_id, quality))["success"]
+
+    batched = SRSServer(db_path=tmp_path / "batched.sqlite")
+    result = json.loads(batched.batch_update_items(reviews))
+
+    assert result["count"] == len(reviews)
+    assert [r["item_id"] for r in result["results"]] == [r[0] for r in reviews]
+
+    def item_state(server: SRSServer) -> list[tuple[Any, ...]]:
+        conn = sqlite3.connect(server.db_path)
+        rows = conn.execute(
+            "SELECT item_id, reps, lapses, round(stability, 6), round(difficulty, 6) "
+            "FROM review_items ORDER BY item_id"
+        ).fetchall()
+        conn.close()
+        return rows
+
+    assert item_state(batched) == item_state(sequential)
+    assert item_state(batched)[1][1:3] == (2, 1)  # ser.001: 2 reps, 1 lapse
+
+    # Invalid reviews are rejected before anything is written
+    error = json.loads(batched.batch_update_items([("item.es.ser.001", 9)]))
+    assert error["error"] == "Invalid quality"
+    error = json.loads(batched.batch_update_items([("item.es.ser.001",)]))
+    assert error["error"] == "Invalid review"
+    error = json.loads(batched.batch_update_items(None))
+    assert error["error"] == "Invalid reviews"
+    sequential.close()
+    batched.close()
+
+
+@pytest.mark.mcp
+@pytest.mark.srs
+@pytest.mark.integration
+def test_srs_queries_use_supplied_reference_time(tmp_path: Path) -> None:
+    """
+    Test the due-items and stats queries evaluate against an explicit `now`
+    rather than the wall clock.
+    """
+    from mcp_servers.srs_server.server import SRSServer
+
+    server = SRSServer(db_path=tmp_path / "mastery.sqlite")
+    review_time = datetime(2025, 1, 10, 12, 0, tzinfo=timezone.utc)
+    result = server._apply_reviews([("item.es.ser.001", 4)], now=review_time)[0]
+    due_at = datetime.fromisoformat(result["next_review_date"])
+
+    assert server._query_due_items("default_learner", 10, now=due_at - timedelta(seconds=1)) == []
+    due = server._query_due_items("default_learner", 10, now=due_at)
+    assert [item.item_id for item in due] == ["item.es.ser.001"]
+    assert due[0].last_review == int(review_time.timestamp())
+
+    stats = server._query_learner_stats("default_learner", now=review_time)
+    assert (stats.total_items, stats.due_count, stats.reviews_today) == (1, 0, 1)
+    server.close()
+
+
+@pytest.mark.mcp
+@pytest.mark.srs
+@pytest.mark.integration
+def test_srs_bulk_upsert_writes_rows_in_one_call(tmp_path: Path) -> None:
+    """
+    Test _update_srs_items_many inserts new rows and overwrites existing ones.
+    """
+    from mcp_servers.srs_server.server import SRSServer
+
+    server = SRSServer(db_path=tmp_path / "mastery.sqlite")
+    rows = [
+        (f"item.es.{i:03d}", "learner1", "node1", "recognition", None, 1000 + i, 1.0, 5.0, 0, 0, 0)
+        for i in range(50)
+    ]
+    assert server._update_srs_items_many(iter(rows)) == 50
+    assert server._update_srs_items_many(
+        [("item.es.000", "learner1", "node1", "recognition", 900, 2000, 3.0, 4.0, 1, 0, 2)]
+    ) == 1
+
+    due = server._query_due_items("learner1", 100, now=datetime.fromtimestamp(1049, timezone.utc))
+    assert len(due) == 49
+    assert due[0].item_id == "item.es.001"
+    stats = server._query_learner_stats("learner1")
+    assert (stats.total_items, stats.new_count, stats.review_count) == (50, 49, 1)
+    server.close()
+
+
+@pytest.mark.mcp
+@pytest.mark.srs
+@pytest.mark.integration
+def test_srs_due_returns_iso_timestamps(tmp_path: Path) -> None:
+    """
+    Test srs.due reports timestamps as ISO 8601 UTC strings, matching
+    srs.update's next_review_date, although they are stored as epoch seconds.
+    """
+    from mcp_servers.srs_server.server import SRSServer
+
+    server = SRSServer(db_path=tmp_path / "mastery.sqlite")
+    server._update_srs_items_many([
+        ("item.es.001", "learner1", "node1", "recognition", 1761991200, 1762250400, 3.2, 5.1, 4, 1, 2),
+        ("item.es.002", "learner1", "node1", "recognition", None, 1762250400, 0.0, 0.0, 0, 0, 0),
+    ])
+
+    items = json.loads(server.get_due_items("learner1"))["items"]
+    by_id = {i["item_id"]: (i["last_review"], i["due_date"]) for i in items}
+    assert by_id == {
+        "item.es.001": ("2025-11-01T10:00:00+00:00", "2025-11-04T10:00:00+00:00"),
+        "item.es.002": (None, "2025-11-04T10:00:00+00:00"),
+    }
+    server.close()
+
+
+@pytest.mark.mcp
+@pytest.mark.srs
+@pytest.mark.integration
+def test_srs_mastered_fallback_returns_iso_timestamps(tmp_path: Path) -> None:
+    """
+    Test srs.mastered's review_items fallback reports last_review as an ISO
+    8601 UTC string, like srs.due, although it is stored as epoch seconds.
+    """
+    from mcp_servers.srs_server.server import SRSServer
+
+    server = SRSServer(db_path=tmp_path / "mastery.sqlite")
+    server._update_srs_items_many([
+        ("item.es.001", "learner1", "node1", "recognition", 1761991200, 1762250400, 30.0, 5.1, 4, 0, 2),
+    ])
+
+    items = json.loads(server.get_mastered_items("learner1"))["items"]
+    assert [(i["item_id"], i["last_review"]) for i in items] == [
+        ("item.es.001", "2025-11-01T10:00:00+00:00"),
+    ]
+    server.close()
+
+
+
+@pytest.mark.mcp
+@pytest.mark.srs
+@pytest.mark.integration
+def test_srs_server_drops_legacy_single_column_indexes(tmp_path: Path) -> None:
+    """
+    Test opening an existing database replaces the old per-column indexes
+    with the composite (learner_id, next_review) index.
+    """
+    from mcp_servers.srs_server.server import SRSServer
+
+    db_path = tmp_path / "mastery.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE review_items (
+            item_id TEXT PRIMARY KEY,
+            learner_id TEXT NOT NULL,
+            node_id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            last_review TIMESTAMP,
+            next_review TIMESTAMP NOT NULL,
+            stability REAL NOT NULL,
+            difficulty REAL NOT NULL,
+            reps INTEGER NOT NULL,
+            lapses INTEGER NOT NULL,
+            state INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX idx_review_items_learner ON review_items(learner_id);
+        CREATE INDEX idx_review_items_next_review ON review_items(next_review);
+        """
+    )
+    conn.close()
+
+    server = SRSServer(db_path=db_path)
+    indexes = [
+        name
+        for (name,) in server._get_conn().execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name = 'review_items' AND sql IS NOT NULL"
+        )
+    ]
+    assert indexes == ["idx_review_items_learner_due"]
+    server.close()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Tests for the frequency index builder (scripts/build_frequency_index.py).
+
+These build small XLSX workbooks in a temporary directory and check that
+ragged worksheets still load into rectangular TSV files and SQLite tables.
+"""
+
+from __future__ import annotations
+
+import csv
+import sqlite3
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from scripts.build_frequency_index import iter_xlsx_rows, stream_to_tsv_and_sqlite
+
+
+SHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+
+def write_xlsx(path: Path, rows: list[list[tuple[str, str]]]) -> None:
+    """Write a minimal workbook whose first sheet has the given (ref, text) cells and no <dimension>."""
+    sheet_rows = []
+    for number, cells in enumerate(rows, start=1):
+        cell_xml = "".join(
+            f'<c r="{ref}" t="inlineStr"><is><t>{text}</t></is></c>' for ref, text in cells
+        )
+        sheet_rows.append(f'<row r="{number}">{cell_xml}</row>')
+    sheet = f'<worksheet xmlns="{SHEET_NS}"><sheetData>{"".join(sheet_rows)}</sheetData></worksheet>'
+
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("xl/worksheets/sheet1.xml", sheet)
+
+
+@pytest.mark.integration
+def test_sparse_sheet_without_dimension_loads(tmp_path: Path) -> None:
+    """Rows with empty trailing cells are padded to the header width."""
+    xlsx_path = tmp_path / "sparse.xlsx"
+    write_xlsx(xlsx_path, [
+        [("A1", "Word"), ("B1", "Freq"), ("C1", "Note")],
+        [("A2", "casa"), ("B2", "12")],
+        [("A3", "perro")],
+        [("A4", "gato"), ("C4", "x")],
+    ])
+
+    # Without a <dimension>, each row only reaches its own last cell
+    assert [len(row) for row in iter_xlsx_rows(xlsx_path)] == [3, 2, 1, 3]
+
+    tsv_path = tmp_path / "sparse.tsv"
+    conn = sqlite3.connect(":memory:")
+    header = stream_to_tsv_and_sqlite(conn.cursor(), "sparse", tsv_path, iter_xlsx_rows(xlsx_path))
+
+    expected = [
+        ("casa", "12", ""),
+        ("perro", "", ""),
+        ("gato", "", "x"),
+    ]
+    assert header == ["Word", "Freq", "Note"]
+    assert conn.execute('SELECT * FROM "sparse"').fetchall() == expected
+
+    with tsv_path.open(encoding="utf-8", newline="") as f:
+        tsv_rows = list(csv.reader(f, delimiter="\t"))
+    assert tsv_rows == [header, *map(list, expected)]
@@ -67,6 +67,7 @@ def test_kg_db_indexes_exist(tmp_kg_db: Path) -> None:
     expected_indexes = {
         "idx_nodes_type",
         "idx_nodes_cefr",
+        "idx_nodes_cefr_node",
         "idx_edges_source",
         "idx_edges_target",
         "idx_edges_type",
@@ -163,6 +163,348 @@ def test_coach_records_to_database():
     coach.end_session(session['session_id'])
 
 
+@pytest.mark.integration
+def test_coach_record_exercise_is_atomic(tmp_mastery_db):
+    """
+    Smoke test: A failed exercise leaves no partial writes behind.
+
+    Verifies:
+    - An error after the items upsert rolls the whole exercise back
+    - The shared connection is usable again afterwards
+    """
+    import sqlite3
+
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    session = coach.start_session(learner_id="atomicity_test")
+    item_id = "smoke.atomicity.test.001"
+
+    # learner_response=None fails in the strand-table insert, after the upsert
+    with pytest.raises(RuntimeError):
+        coach.record_exercise(
+            session_id=session['session_id'],
+            item_id=item_id,
+            quality=3,
+            learner_response=None,
+            duration_seconds=5,
+            strand="meaning_input"
+        )
+
+    conn = sqlite3.connect(coach.mastery_db_path)
+    count = conn.execute("SELECT COUNT(*) FROM items WHERE item_id = ?", (item_id,)).fetchone()[0]
+    conn.close()
+    assert count == 0, "Failed exercise should not leave an items row"
+
+    summary = coach.end_session(session['session_id'])
+    assert summary['exercises_completed'] == 0
+    coach.close()
+
+
+@pytest.mark.integration
+def test_coach_batches_exercise_commits(tmp_mastery_db):
+    """
+    Smoke test: batch_size groups several exercises into one commit.
+
+    Verifies:
+    - Exercises stay invisible to other connections until the batch fills
+    - A failed exercise inside a batch keeps the earlier pending ones
+    - end_session() commits a partial batch
+    """
+    import sqlite3
+
+    coach = Coach(mastery_db_path=tmp_mastery_db, batch_size=3)
+    session = coach.start_session(learner_id="batch_test")
+    item_ids = [f"smoke.batch.test.{i:03d}" for i in range(5)]
+
+    def committed_count():
+        conn = sqlite3.connect(coach.mastery_db_path, timeout=0)
+        placeholders = ",".join("?" * len(item_ids))
+        count = conn.execute(
+            f"SELECT COUNT(*) FROM items WHERE item_id IN ({placeholders})", item_ids
+        ).fetchone()[0]
+        conn.close()
+        return count
+
+    def record(item_id, response="ok"):
+        coach.record_exercise(
+            session_id=session['session_id'],
+            item_id=item_id,
+            quality=4,
+            learner_response=response,
+            duration_seconds=5,
+            strand="meaning_input"
+        )
+
+    record(item_ids[0])
+    record(item_ids[1])
+    assert committed_count() == 0, "Pending exercises should not be committed yet"
+
+    with pytest.raises(RuntimeError):
+        record("smoke.batch.test.failed", response=None)
+
+    record(item_ids[2])
+    assert committed_count() == 3, "A full batch should be committed"
+
+    record(item_ids[3])
+    record(item_ids[4])
+    assert committed_count() == 3
+
+    summary = coach.end_session(session['session_id'])
+    assert summary['exercises_completed'] == 5
+    assert committed_count() == 5, "end_session() should commit a partial batch"
+    coach.close()
+
+
+@pytest.mark.integration
+def test_coach_dual_writes_last_review_ms(tmp_mastery_db):
+    """
+    Smoke test: record_exercise() keeps last_review_ms in step with last_review.
+
+    Verifies:
+    - A fresh schema gets the epoch-millisecond column
+    - Both timestamps describe the same instant after repeated reviews
+    """
+    import sqlite3
+    from datetime import datetime
+
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    session = coach.start_session(learner_id="last_review_ms_test")
+    item_id = "smoke.last_review_ms.test.001"
+
+    for quality in (4, 5):
+        coach.record_exercise(
+            session_id=session['session_id'],
+            item_id=item_id,
+            quality=quality,
+            learner_response="ok",
+            duration_seconds=5,
+            strand="meaning_input"
+        )
+    coach.end_session(session['session_id'])
+    coach.close()
+
+    conn = sqlite3.connect(tmp_mastery_db)
+    last_review, last_review_ms, reps = conn.execute(
+        "SELECT last_review, last_review_ms, reps FROM items WHERE item_id = ?", (item_id,)
+    ).fetchone()
+    conn.close()
+
+    assert reps == 2
+    assert last_review_ms == int(datetime.fromisoformat(last_review).timestamp() * 1000)
+
+
+@pytest.mark.integration
+def test_coach_keeps_item_review_totals(tmp_mastery_db):
+    """
+    Smoke test: record_exercise() keeps the items review totals current.
+
+    Verifies:
+    - quality_sum and review_count match the item's review_history rows
+    """
+    import sqlite3
+
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    session = coach.start_session(learner_id="review_totals_test")
+    item_id = "smoke.review_totals.test.001"
+
+    for quality in (3, 5, 4):
+        coach.record_exercise(
+            session_id=session['session_id'],
+            item_id=item_id,
+            quality=quality,
+            learner_response="ok",
+            duration_seconds=5,
+            strand="language_focused"
+        )
+    coach.end_session(session['session_id'])
+    coach.close()
+
+    conn = sqlite3.connect(tmp_mastery_db)
+    totals = conn.execute(
+        "SELECT quality_sum, review_count FROM items WHERE item_id = ?", (item_id,)
+    ).fetchone()
+    history = conn.execute(
+        "SELECT SUM(quality), COUNT(*) FROM review_history WHERE item_id = ?", (item_id,)
+    ).fetchone()
+    conn.close()
+
+    assert totals == history == (12, 3)
+
+
+@pytest.mark.integration
+def test_coach_preloaded_items_match_database(tmp_mastery_db):
+    """
+    Smoke test: Items preloaded at session start give the same reviews.
+
+    Verifies:
+    - Preloaded rows equal the per-item fetch
+    - A recorded item is dropped from the cache, so repeats read fresh state
+    """
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    session = coach.start_session(learner_id="preload_test")
+    item_id = "smoke.preload.test.001"
+
+    def record():
+        return coach.record_exercise(
+            session_id=session['session_id'],
+            item_id=item_id,
+            quality=4,
+            learner_response="ok",
+            duration_seconds=5,
+            strand="meaning_input"
+        )
+
+    record()
+    info = coach.active_sessions[session['session_id']]
+    info.item_cache = coach._preload_items([{"item_id": item_id}, {"item_id": None}])
+
+    expected = coach._conn.execute(coach._fetch_item_sql, (item_id,)).fetchone()
+    assert info.item_cache == {item_id: expected}
+
+    record()
+    assert item_id not in info.item_cache, "Recorded item should leave the cache"
+    third = record()
+
+    reps = coach._conn.execute("SELECT reps FROM items WHERE item_id = ?", (item_id,)).fetchone()[0]
+    assert reps == 3
+    assert third.new_stability > 0
+
+    coach.end_session(session['session_id'])
+    coach.close()
+
+
+@pytest.mark.integration
+def test_coach_session_ids_are_time_ordered(tmp_mastery_db):
+    """
+    Smoke test: Session IDs are compact and sort in creation order.
+
+    Verifies:
+    - IDs are 16 hex digits
+    - A later session's ID sorts after an earlier one
+    """
+    import time
+
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    first = coach.start_session(learner_id="session_id_test")['session_id']
+    time.sleep(0.002)
+    second = coach.start_session(learner_id="session_id_test")['session_id']
+
+    for session_id in (first, second):
+        assert len(session_id) == 16
+        int(session_id, 16)
+    assert first < second
+
+    coach.end_session(first)
+    coach.end_session(second)
+    coach.close()
+
+
+@pytest.mark.integration
+def test_coach_cached_strand_balance_matches_database(tmp_mastery_db):
+    """
+    Smoke test: The in-memory strand balance tracks the database view.
+
+    Verifies:
+    - Balances returned by record_exercise() equal a fresh aggregate,
+      with two learners' sessions interleaved on one Coach
+    - Totals cached on an earlier day are re-read from the view
+    - The cache is dropped when a session ends
+    """
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    sessions = [
+        coach.start_session(learner_id=learner_id)['session_id']
+        for learner_id in ("balance_cache_test_a", "balance_cache_test_b")
+    ]
+
+    def record(index, strand):
+        result = coach.record_exercise(
+            session_id=sessions[index % 2],
+            item_id=f"smoke.balance.test.{index:03d}",
+            quality=4,
+            learner_response="Balance cache test",
+            duration_seconds=42,
+            strand=strand
+        )
+        fresh = coach.planner.get_strand_balance("balance_cache_test", conn=coach._conn)
+        for name, percentage in result.strand_balance.items():
+            assert percentage == pytest.approx(getattr(fresh, name))
+
+    for index, strand in enumerate(["meaning_input", "fluency", "meaning_output", "language_focused"]):
+        record(index, strand)
+
+    # Pretend the totals were read yesterday: they must not be advanced
+    coach._balance_cache = ("2000-01-01", dict.fromkeys(coach._balance_cache[1], 0), set())
+    record(4, "fluency")
+
+    coach.end_session(sessions[0])
+    assert coach._balance_cache is None
+    coach.end_session(sessions[1])
+    coach.close()
+
+
+@pytest.mark.integration
+def test_coach_strand_seconds_match_view_for_every_strand(tmp_mastery_db):
+    """
+    Smoke test: The seconds the coach adds per exercise equal what the
+    strand_balance_recent view counts for it.
+
+    Verifies:
+    - For every strand, the cached per-strand totals after an exercise equal
+      the view's totals, so the constants in coach.py agree with the view
+    """
+    from state.coach import STRAND_NAMES
+
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+    session_id = coach.start_session(learner_id="strand_seconds_test")['session_id']
+
+    def view_seconds():
+        totals = dict.fromkeys(STRAND_NAMES, 0)
+        for _, strand, seconds in coach.planner.get_strand_seconds(conn=coach._conn):
+            totals[strand] += seconds
+        return totals
+
+    cases = [(strand, 42) for strand in STRAND_NAMES] + [("fluency", 0)]
+    for index, (strand, duration) in enumerate([("language_focused", 42), *cases]):
+        coach.record_exercise(
+            session_id=session_id,
+            item_id=f"smoke.strand_seconds.test.{index:03d}",
+            quality=4,
+            learner_response="Strand seconds test",
+            duration_seconds=duration,
+            strand=strand
+        )
+        assert coach._balance_cache[1] == view_seconds(), strand
+
+    coach.end_session(session_id)
+    coach.close()
+
+
+@pytest.mark.unit
+def test_coach_preview_cache_is_bounded(monkeypatch, tmp_mastery_db):
+    """
+    Smoke test: Preview plans expire and the cache stays bounded.
+
+    Verifies:
+    - The least recently previewed learner is evicted past the size cap
+    - An expired preview is dropped instead of being reused
+    """
+    import state.coach as coach_module
+
+    monkeypatch.setattr(coach_module, "PREVIEW_CACHE_MAX", 2)
+    coach = Coach(mastery_db_path=tmp_mastery_db)
+
+    for learner_id in ("preview_a", "preview_b", "preview_c"):
+        coach.preview_session(learner_id=learner_id, duration_minutes=5)
+    assert list(coach._preview_cache) == ["preview_b", "preview_c"]
+
+    coach._preview_ttl_ns = -1
+    coach.preview_session(learner_id="preview_d", duration_minutes=5)
+    session = coach.start_session(learner_id="preview_d", duration_minutes=5)
+    assert "preview_d" not in coach._preview_cache
+
+    coach.end_session(session['session_id'])
+    coach.close()
+
+
 @pytest.mark.unit
 def test_coach_quality_scale():
     """